@@ -9,6 +9,7 @@ from pathlib import Path
 from typing import Any
 
 from architect.backends.base import AgentBackend, BackendExecutionError, BackendProcessError
+from architect.jsonio import loads_json
 
 
 class ClaudeCodeBackend(AgentBackend):
@@ -98,7 +99,7 @@ class ClaudeCodeBackend(AgentBackend):
                     continue
                 candidate = f"{parse_buffer}{line}" if parse_buffer else line
                 try:
-                    event = json.loads(candidate)
+                    event = loads_json(candidate)
                     parse_buffer = ""
                 except json.JSONDecodeError:
                     if self._appears_partial_json(candidate):
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import asyncio
-import fnmatch
 import importlib.util
 import json
 import shutil
@@ -20,6 +19,7 @@ from architect.backends import (
     RetryPolicy,
 )
 from architect.config import ArchitectConfig, BackendName, load_config, save_config
+from architect.globs import compile_globs
 from architect.specialists import (
     CoderAgent,
     CriticAgent,
@@ -214,8 +214,13 @@ def _load_runtime(repo_root: Path, config_path: Path) -> Runtime:
         repo_root,
         backend_mode=config.state.backend,
         branch_ref=config.state.branch_ref,
+        write_behind=config.state.write_behind,
+    )
+    patches = PatchStackManager(
+        repo_root,
+        state_store=state,
+        write_commit_graph=config.state.write_commit_graph,
     )
-    patches = PatchStackManager(repo_root, state_store=state)
     backend = _build_backend(config, repo_root, state)
     supervisor_agent = SupervisorAgent(backend, model=config.agents.supervisor_model)
     supervisor = Supervisor(
@@ -248,11 +253,7 @@ def _record_patch_metric(state: GitNotesStore, metric_key: str, patch_hash: str)
 
 
 def _matches_forbidden_path(path: str, patterns: list[str]) -> str | None:
-    normalized = path.replace("\\", "/")
-    for pattern in patterns:
-        if fnmatch.fnmatch(normalized, pattern):
-            return pattern
-    return None
+    return compile_globs(patterns).first_match(path)
 
 
 def _ensure_patch_allowed(patch_files: list[str], config: ArchitectConfig) -> None:
@@ -334,6 +335,7 @@ def init_command(backend: str | None, config_value: str) -> None:
         repo_root,
         backend_mode=config.state.backend,
         branch_ref=config.state.branch_ref,
+        write_behind=config.state.write_behind,
     )
     patches = PatchStackManager(repo_root, state_store=state)
     if not state.get_context():
@@ -51,7 +51,10 @@ class WorkflowConfig:
     branch_strategy: BranchStrategy = "single_branch_queue"
     task_max_attempts: int = 2
     task_retry_backoff_seconds: float = 0.0
+    task_retry_backoff_max_seconds: float = 60.0
     max_conflict_cycles: int = 2
+    parallel_conflict_inputs: bool = False
+    parallel_quality_commands: bool = False
     fallback_artifact_mode: FallbackArtifactMode = "local_only"
     tracked_fallback_dir: str = "docs/architect-runs"
     test_coverage_threshold: int = 0
@@ -77,6 +80,8 @@ class GuardrailsConfig:
 class StateConfig:
     backend: StateBackendName = "notes"
     branch_ref: str = "architect/state"
+    write_behind: bool = False
+    write_commit_graph: bool = False
 
 
 @dataclass(slots=True)
@@ -136,7 +141,10 @@ class ArchitectConfig:
                 "branch_strategy": self.workflow.branch_strategy,
                 "task_max_attempts": self.workflow.task_max_attempts,
                 "task_retry_backoff_seconds": self.workflow.task_retry_backoff_seconds,
+                "task_retry_backoff_max_seconds": self.workflow.task_retry_backoff_max_seconds,
                 "max_conflict_cycles": self.workflow.max_conflict_cycles,
+                "parallel_conflict_inputs": self.workflow.parallel_conflict_inputs,
+                "parallel_quality_commands": self.workflow.parallel_quality_commands,
                 "fallback_artifact_mode": self.workflow.fallback_artifact_mode,
                 "tracked_fallback_dir": self.workflow.tracked_fallback_dir,
                 "test_coverage_threshold": self.workflow.test_coverage_threshold,
@@ -152,6 +160,8 @@ class ArchitectConfig:
             "state": {
                 "backend": self.state.backend,
                 "branch_ref": self.state.branch_ref,
+                "write_behind": self.state.write_behind,
+                "write_commit_graph": self.state.write_commit_graph,
             },
         }
 
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import fnmatch
+import os
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass
+from functools import lru_cache
+
+
+def _glob_subject(path: str) -> str:
+    return os.path.normcase(path.replace("\\", "/"))
+
+
+_GLOB_META_PATTERN = re.compile(r"[*?\[]")
+
+
+@dataclass(frozen=True, slots=True)
+class GlobSet:
+    # fnmatch patterns folded into one alternation so each path is matched once. When every
+    # pattern starts with a literal segment, paths sharing none of those prefixes are
+    # rejected with one startswith call before the regex runs.
+    patterns: tuple[str, ...]
+    regex: re.Pattern[str] | None
+    prefixes: tuple[str, ...] | None = None
+
+    def __bool__(self) -> bool:
+        return self.regex is not None
+
+    def match(self, path: str) -> re.Match[str] | None:
+        if self.regex is None:
+            return None
+        subject = _glob_subject(path)
+        if self.prefixes is not None and not subject.startswith(self.prefixes):
+            return None
+        return self.regex.match(subject)
+
+    def first_match(self, path: str) -> str | None:
+        matched = self.match(path)
+        if matched is None or matched.lastgroup is None:
+            return None
+        return self.patterns[int(matched.lastgroup[1:])]
+
+
+def _glob_literal_prefix(pattern: str) -> str:
+    meta = _GLOB_META_PATTERN.search(pattern)
+    return pattern if meta is None else pattern[: meta.start()]
+
+
+def compile_globs(patterns: Iterable[str]) -> GlobSet:
+    """Compile fnmatch-style patterns into a reusable :class:`GlobSet`."""
+    return _compile_glob_tuple(tuple(patterns))
+
+
+@lru_cache(maxsize=32)
+def _compile_glob_tuple(patterns: tuple[str, ...]) -> GlobSet:
+    # Same semantics as fnmatch.fnmatch; the named group of the winning branch maps back to
+    # the original pattern. Guardrail lists are few and fixed, so compiled sets are shared.
+    if not patterns:
+        return GlobSet((), None)
+    normalized = [os.path.normcase(pattern) for pattern in patterns]
+    combined = "|".join(
+        f"(?P<g{index}>{fnmatch.translate(pattern)})" for index, pattern in enumerate(normalized)
+    )
+    prefixes = tuple(_glob_literal_prefix(pattern) for pattern in normalized)
+    return GlobSet(patterns, re.compile(combined), None if "" in prefixes else prefixes)
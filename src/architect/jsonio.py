@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import json
+import re
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional accelerator; see the `fast_json` extra
+    orjson = None
+
+# orjson decodes integers outside [-2**63, 2**64) as floats. Any run of 19 digits (the width
+# of 2**63) sends a payload to the stdlib parser, which keeps such integers exact.
+_LONG_DIGITS_TEXT = re.compile(r"\d{19}")
+_LONG_DIGITS_BYTES = re.compile(rb"\d{19}")
+
+
+def dumps_json(payload: Any, *, indent: bool = False) -> bytes:
+    """Serialize state payloads to UTF-8 JSON, preferring orjson when it is installed."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        try:
+            return orjson.dumps(payload, option=option)
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits; the stdlib encoder handles them.
+    if indent:
+        return json.dumps(payload, ensure_ascii=False, indent=2).encode("utf-8")
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def loads_json(payload: str | bytes) -> Any:
+    """Parse state payloads; raises json.JSONDecodeError for malformed input."""
+    if orjson is not None:
+        pattern = _LONG_DIGITS_TEXT if isinstance(payload, str) else _LONG_DIGITS_BYTES
+        if pattern.search(payload) is None:
+            return orjson.loads(payload)
+    return json.loads(payload)
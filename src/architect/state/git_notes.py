@@ -1,24 +1,54 @@
 from __future__ import annotations
 
+import atexit
 import json
 import os
+import queue
+import random
+import shutil
 import subprocess
 import tempfile
+import threading
 import time
-from collections.abc import Callable
-from contextlib import contextmanager
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager, suppress
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
+from architect.jsonio import dumps_json, loads_json
+
 
 class ArchitectStateError(RuntimeError):
     """Raised when shared-state operations fail."""
 
 
+class StateConflictError(ArchitectStateError):
+    """Raised when an expected revision no longer matches the stored envelope."""
+
+    def __init__(self, message: str, current: dict[str, Any]) -> None:
+        super().__init__(message)
+        self.current = current
+
+
 class GitNotesStore:
-    NAMESPACES = {"tasks", "decisions", "context", "checkpoints", "metrics", "leases", "runs"}
+    NAMESPACES = frozenset(
+        {"tasks", "decisions", "context", "checkpoints", "metrics", "leases", "runs"}
+    )
     SCHEMA_VERSION = 1
+    _READ_CACHED_NAMESPACES = frozenset({"context", "metrics"})
+    # Resolved once at import so each git invocation skips the PATH search.
+    _GIT = shutil.which("git") or "git"
+    _INDEX_ENV_KEYS = (
+        "PATH",
+        "HOME",
+        "USER",
+        "LANG",
+        "LC_ALL",
+        "TMPDIR",
+        "SYSTEMROOT",
+        "XDG_CONFIG_HOME",
+    )
 
     def __init__(
         self,
@@ -26,21 +56,52 @@ class GitNotesStore:
         *,
         backend_mode: str = "notes",
         branch_ref: str = "architect/state",
+        write_behind: bool = False,
+        read_cache_ttl: float = 0.5,
     ) -> None:
         self.repo_root = repo_root.resolve()
+        # `git -C` instead of cwd= keeps every spawn eligible for os.posix_spawn.
+        self._git_prefix = (self._GIT, "-C", str(self.repo_root), "--no-pager")
         self.local_state_dir = self.repo_root / ".architect" / "state"
         self.local_state_dir.mkdir(parents=True, exist_ok=True)
         self.anchor_file = self.repo_root / ".architect" / "anchor"
         self.lock_file = self.local_state_dir / ".lock"
+        self._local_paths = {ns: self.local_state_dir / f"{ns}.json" for ns in self.NAMESPACES}
+        self._notes_refs = {ns: f"refs/notes/architect/{ns}" for ns in self.NAMESPACES}
         self._git_repo_available = self._is_git_repo()
         self._requested_backend_mode = backend_mode
         self._branch_ref = branch_ref
+        self._state_ref = (
+            branch_ref if branch_ref.startswith("refs/") else f"refs/heads/{branch_ref}"
+        )
         if backend_mode not in {"notes", "branch", "local"}:
             raise ArchitectStateError(f"Unsupported state backend mode: {backend_mode}")
         if backend_mode == "local" or not self._git_repo_available:
             self._backend_mode = "local"
         else:
             self._backend_mode = backend_mode
+        # Minimal environment for the temporary-index plumbing in _write_branch_json; keeps
+        # git identity/config overrides without copying all of os.environ per write.
+        self._base_env = {
+            key: value
+            for key, value in os.environ.items()
+            if key in self._INDEX_ENV_KEYS or (key.startswith("GIT_") and key != "GIT_INDEX_FILE")
+        }
+        self._write_behind = write_behind
+        # Serialized envelopes accepted by set_json but possibly not yet persisted.
+        self._envelope_cache: dict[str, str] = {}
+        self._cache_lock = threading.Lock()
+        self._write_queue: queue.Queue[tuple[str, str]] = queue.Queue()
+        self._writer_thread: threading.Thread | None = None
+        self._writer_error: Exception | None = None
+        # Short-lived read cache for the hot context/metrics namespaces; local writes refresh
+        # the entry, so staleness is bounded by the TTL only for writes from other processes.
+        self._read_cache_ttl = read_cache_ttl
+        self._ttl_cache: dict[str, tuple[float, str]] = {}
+        # Serialized envelopes buffered by an open transaction(), keyed by namespace, and the
+        # stored revision each buffered namespace started from.
+        self._transaction: dict[str, str] | None = None
+        self._transaction_bases: dict[str, int] = {}
 
     @property
     def git_enabled(self) -> bool:
@@ -56,10 +117,10 @@ class GitNotesStore:
 
     def _is_git_repo(self) -> bool:
         proc = subprocess.run(
-            ["git", "--no-pager", "rev-parse", "--is-inside-work-tree"],
-            cwd=self.repo_root,
+            [*self._git_prefix, "rev-parse", "--is-inside-work-tree"],
             text=True,
             capture_output=True,
+            close_fds=False,
         )
         return proc.returncode == 0 and proc.stdout.strip() == "true"
 
@@ -70,66 +131,60 @@ class GitNotesStore:
         env: dict[str, str] | None = None,
         check: bool = True,
     ) -> subprocess.CompletedProcess[str]:
+        # Descriptors opened by Python are non-inheritable (PEP 446), so close_fds=False is
+        # safe here. With an absolute git path, no cwd= and no preexec_fn, subprocess can use
+        # posix_spawn (vfork-based) instead of fork+exec; keep new call sites that way.
         proc = subprocess.run(
-            ["git", "--no-pager", *args],
-            cwd=self.repo_root,
+            [*self._git_prefix, *args],
             text=True,
             capture_output=True,
             input=input_text,
             env=env,
+            close_fds=False,
         )
         if check and proc.returncode != 0:
             raise ArchitectStateError(proc.stderr.strip() or proc.stdout.strip())
         return proc
 
-    @staticmethod
-    def _validate_namespace(namespace: str) -> None:
-        if namespace not in GitNotesStore.NAMESPACES:
+    def _validate_namespace(self, namespace: str) -> None:
+        if namespace not in self._notes_refs:
             raise ArchitectStateError(f"Unsupported namespace: {namespace}")
 
-    def _local_file(self, namespace: str) -> Path:
-        return self.local_state_dir / f"{namespace}.json"
-
-    def _notes_ref(self, namespace: str) -> str:
-        return f"refs/notes/architect/{namespace}"
-
     def _state_branch_ref(self) -> str:
-        if self._branch_ref.startswith("refs/"):
-            return self._branch_ref
-        return f"refs/heads/{self._branch_ref}"
-
-    def _state_branch_exists(self) -> bool:
-        proc = self._run_git(
-            ["show-ref", "--verify", "--quiet", self._state_branch_ref()],
-            check=False,
-        )
-        return proc.returncode == 0
+        return self._state_ref
 
-    def _read_branch_json(self, namespace: str) -> Any:
-        proc = self._run_git(
-            ["show", f"{self._state_branch_ref()}:{namespace}.json"],
-            check=False,
+    def _read_git_json(self, args: list[str]) -> Any:
+        # Capture raw bytes and hand them straight to the parser, which tolerates the trailing
+        # newline git appends, so no decoded or stripped copy of the payload is made.
+        proc = subprocess.run(
+            [*self._git_prefix, *args],
+            capture_output=True,
+            close_fds=False,
         )
         if proc.returncode != 0:
             return None
-        content = proc.stdout.strip()
-        if not content:
-            return None
+        return self._parse_json_bytes(proc.stdout)
+
+    @staticmethod
+    def _parse_json_bytes(payload: bytes) -> Any:
         try:
-            return json.loads(content)
-        except json.JSONDecodeError:
+            return loads_json(payload)
+        except (json.JSONDecodeError, UnicodeDecodeError):
             return None
 
-    def _write_branch_json(self, namespace: str, serialized: str) -> None:
+    def _read_branch_json(self, namespace: str) -> Any:
+        return self._read_git_json(["show", f"{self._state_branch_ref()}:{namespace}.json"])
+
+    def _write_branch_json(self, entries: dict[str, str]) -> None:
+        # Every namespace in ``entries`` lands in one state-branch commit.
         ref = self._state_branch_ref()
         parent_commit: str | None = None
         parent_tree: str | None = None
-        if self._state_branch_exists():
-            parent_commit = self._run_git(["rev-parse", ref], check=True).stdout.strip()
-            parent_tree = self._run_git(
-                ["rev-parse", f"{parent_commit}^{{tree}}"],
-                check=True,
-            ).stdout.strip()
+        # One rev-parse resolves both the tip and its tree (printed in argument order); a
+        # non-zero exit means the state branch does not exist yet.
+        proc = self._run_git(["rev-parse", ref, f"{ref}^{{tree}}"], check=False)
+        if proc.returncode == 0:
+            parent_commit, parent_tree = proc.stdout.split()[:2]
 
         with tempfile.NamedTemporaryFile(
             prefix="architect-state-index-",
@@ -138,20 +193,21 @@ class GitNotesStore:
             index_path = index_file.name
 
         try:
-            env = os.environ.copy()
-            env["GIT_INDEX_FILE"] = index_path
+            env = {**self._base_env, "GIT_INDEX_FILE": index_path}
             try:
                 Path(index_path).unlink()
             except FileNotFoundError:
                 pass
             if parent_tree:
                 self._run_git(["read-tree", parent_tree], env=env, check=True)
-            blob_hash = self._run_git(
-                ["hash-object", "-w", "--stdin"],
-                input_text=serialized,
-                check=True,
-            ).stdout.strip()
-            index_info = f"100644 blob {blob_hash}\t{namespace}.json\n"
+            index_info = ""
+            for namespace, serialized in entries.items():
+                blob_hash = self._run_git(
+                    ["hash-object", "-w", "--stdin"],
+                    input_text=serialized,
+                    check=True,
+                ).stdout.strip()
+                index_info += f"100644 blob {blob_hash}\t{namespace}.json\n"
             self._run_git(
                 ["update-index", "--index-info"],
                 input_text=index_info,
@@ -162,7 +218,7 @@ class GitNotesStore:
             commit_args = ["commit-tree", new_tree]
             if parent_commit:
                 commit_args.extend(["-p", parent_commit])
-            commit_message = f"architect-state: update {namespace}\n"
+            commit_message = f"architect-state: update {', '.join(entries)}\n"
             commit_hash = self._run_git(
                 commit_args,
                 input_text=commit_message,
@@ -212,55 +268,64 @@ class GitNotesStore:
             except FileNotFoundError:
                 pass
 
+    @staticmethod
+    def _atomic_write_bytes(path: Path, payload: bytes) -> None:
+        # Stage next to the destination so the rename stays on one filesystem and
+        # readers never observe a partially written state file.
+        fd, temp_path = tempfile.mkstemp(prefix=f".{path.name}.", dir=path.parent)
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(payload)
+            os.replace(temp_path, path)
+        except BaseException:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+            raise
+
     def _read_raw_json(self, namespace: str) -> Any:
         if self.git_enabled and self.backend_mode == "notes":
             anchor = self._anchor_object()
-            proc = self._run_git(
-                ["notes", "--ref", self._notes_ref(namespace), "show", anchor],
-                check=False,
+            return self._read_git_json(
+                ["notes", "--ref", self._notes_refs[namespace], "show", anchor]
             )
-            if proc.returncode != 0:
-                return None
-            content = proc.stdout.strip()
-            if not content:
-                return None
-            try:
-                return json.loads(content)
-            except json.JSONDecodeError:
-                return None
         if self.git_enabled and self.backend_mode == "branch":
             return self._read_branch_json(namespace)
 
-        local_file = self._local_file(namespace)
-        if not local_file.exists():
-            return None
         try:
-            return json.loads(local_file.read_text(encoding="utf-8"))
-        except json.JSONDecodeError:
+            payload = self._local_paths[namespace].read_bytes()
+        except FileNotFoundError:
             return None
+        return self._parse_json_bytes(payload)
+
+    @staticmethod
+    def _serialize(payload: Any) -> str:
+        return dumps_json(payload).decode("utf-8")
 
-    def _write_raw_json(self, namespace: str, payload: Any) -> None:
-        serialized = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+    def _write_serialized(self, namespace: str, serialized: str) -> None:
         if self.git_enabled and self.backend_mode == "notes":
             anchor = self._anchor_object()
+            # Feed the payload on stdin (-F -) so large envelopes never hit ARGV limits.
             self._run_git(
                 [
                     "notes",
                     "--ref",
-                    self._notes_ref(namespace),
+                    self._notes_refs[namespace],
                     "add",
                     "-f",
-                    "-m",
-                    serialized,
+                    "-F",
+                    "-",
                     anchor,
                 ],
+                input_text=serialized,
                 check=True,
             )
             return
         if self.git_enabled and self.backend_mode == "branch":
-            self._write_branch_json(namespace, serialized)
+            self._write_branch_json({namespace: serialized})
             return
-        self._local_file(namespace).write_text(serialized, encoding="utf-8")
+        self._atomic_write_bytes(self._local_paths[namespace], serialized.encode("utf-8"))
 
     def _normalize_envelope(self, raw_payload: Any, default: Any) -> dict[str, Any]:
         if (
@@ -290,7 +355,10 @@ class GitNotesStore:
     def get_envelope(self, namespace: str, default: Any | None = None) -> dict[str, Any]:
         self._validate_namespace(namespace)
         default_value = {} if default is None else default
-        raw = self._read_raw_json(namespace)
+        cached = self._envelope_cache.get(namespace) if self._write_behind else None
+        if cached is None and self._transaction is not None:
+            cached = self._transaction.get(namespace)
+        raw = loads_json(cached) if cached is not None else self._read_raw_json(namespace)
         return self._normalize_envelope(raw, default_value)
 
     def get_json(self, namespace: str, default: Any | None = None) -> Any:
@@ -299,20 +367,189 @@ class GitNotesStore:
 
     def set_json(self, namespace: str, data: Any, expected_revision: int | None = None) -> None:
         self._validate_namespace(namespace)
+        if self._write_behind:
+            self._ttl_cache.pop(namespace, None)
+            self._set_json_deferred(namespace, data, expected_revision)
+            return
+        if self._transaction is not None:
+            current = self.get_envelope(namespace, default={})
+            self._transaction[namespace] = self._next_envelope(
+                namespace, current, data, expected_revision
+            )
+            self._transaction_bases.setdefault(namespace, int(current.get("revision", 1)))
+            # Reads inside the block come from the buffer; the cache is refreshed on commit.
+            self._ttl_cache.pop(namespace, None)
+            return
         with self._state_lock():
             current = self.get_envelope(namespace, default={})
-            current_revision = int(current.get("revision", 1))
-            if expected_revision is not None and expected_revision != current_revision:
-                raise ArchitectStateError(
-                    f"Concurrent state update detected for namespace '{namespace}'."
-                )
-            envelope = {
+            serialized = self._next_envelope(namespace, current, data, expected_revision)
+            self._write_serialized(namespace, serialized)
+            self._refresh_read_cache(namespace, data)
+
+    def _next_envelope(
+        self,
+        namespace: str,
+        current: dict[str, Any],
+        data: Any,
+        expected_revision: int | None,
+    ) -> str:
+        current_revision = int(current.get("revision", 1))
+        if expected_revision is not None and expected_revision != current_revision:
+            raise StateConflictError(
+                f"Concurrent state update detected for namespace '{namespace}'.", current
+            )
+        return self._serialize(
+            {
                 "schema_version": self.SCHEMA_VERSION,
                 "revision": current_revision + 1,
                 "updated_at": self._utcnow_iso(),
                 "data": data,
             }
-            self._write_raw_json(namespace, envelope)
+        )
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Buffer ``set_json`` writes and persist them together when the block exits."""
+        # Write-behind already coalesces writes, and nested blocks join the outer one.
+        if self._write_behind or self._transaction is not None:
+            yield
+            return
+        self._transaction = {}
+        self._transaction_bases = {}
+        try:
+            yield
+        except BaseException:
+            # Writes made before an exception are kept, as they would be without the block,
+            # unless another writer got there first or the flush itself fails; the original
+            # error is what surfaces.
+            with suppress(Exception):
+                self._commit_transaction()
+            raise
+        self._commit_transaction()
+
+    def _commit_transaction(self) -> None:
+        pending, self._transaction = self._transaction, None
+        bases, self._transaction_bases = self._transaction_bases, {}
+        if not pending:
+            return
+        with self._state_lock():
+            # Buffered envelopes were built against the revisions read when each namespace
+            # was first written; any write from another process since then is a conflict.
+            for namespace, base_revision in bases.items():
+                stored = self._normalize_envelope(self._read_raw_json(namespace), {})
+                if int(stored["revision"]) != base_revision:
+                    raise StateConflictError(
+                        f"Concurrent state update detected for namespace '{namespace}'.",
+                        stored,
+                    )
+            self._write_many(pending)
+        for namespace, serialized in pending.items():
+            self._refresh_read_cache(namespace, loads_json(serialized).get("data"))
+
+    def _write_many(self, pending: dict[str, str]) -> None:
+        if not self.git_enabled:
+            self._flush_batch(
+                [
+                    (self._local_paths[namespace], serialized.encode("utf-8"))
+                    for namespace, serialized in pending.items()
+                ]
+            )
+        elif self.backend_mode == "branch":
+            self._write_branch_json(pending)
+        else:
+            for namespace, serialized in pending.items():
+                self._write_serialized(namespace, serialized)
+
+    def _refresh_read_cache(self, namespace: str, data: Any) -> None:
+        # Write-through for the read-cached namespaces: callers typically read context or
+        # metrics right after writing them, and that read is served without another git call.
+        if (
+            self._read_cache_ttl > 0
+            and namespace in self._READ_CACHED_NAMESPACES
+            and isinstance(data, dict)
+        ):
+            self._ttl_cache[namespace] = (time.monotonic(), self._serialize(data))
+        else:
+            self._ttl_cache.pop(namespace, None)
+
+    def _set_json_deferred(self, namespace: str, data: Any, expected_revision: int | None) -> None:
+        # Revision checks run against the in-memory envelope; persistence happens on the
+        # writer thread so callers do not wait on git.
+        with self._cache_lock:
+            self._raise_writer_error()
+            current = self.get_envelope(namespace, default={})
+            serialized = self._next_envelope(namespace, current, data, expected_revision)
+            self._envelope_cache[namespace] = serialized
+            self._ensure_writer()
+            self._write_queue.put((namespace, serialized))
+
+    def _raise_writer_error(self) -> None:
+        # A failed background write is reported once; later writes get a fresh attempt
+        # instead of failing forever on one transient git error.
+        error, self._writer_error = self._writer_error, None
+        if error is not None:
+            raise ArchitectStateError(f"Deferred state write failed: {error}") from error
+
+    def _ensure_writer(self) -> None:
+        if self._writer_thread is not None:
+            return
+        self._writer_thread = threading.Thread(
+            target=self._drain_writes,
+            name="architect-state-writer",
+            daemon=True,
+        )
+        self._writer_thread.start()
+        atexit.register(self.flush)
+
+    def _drain_writes(self) -> None:
+        while True:
+            jobs = [self._write_queue.get()]
+            while True:
+                try:
+                    jobs.append(self._write_queue.get_nowait())
+                except queue.Empty:
+                    break
+            # Later envelopes supersede earlier ones, so only the newest per namespace
+            # needs to reach the backend.
+            latest: dict[str, str] = {}
+            for namespace, serialized in jobs:
+                latest[namespace] = serialized
+            try:
+                with self._state_lock():
+                    self._write_many(latest)
+            except Exception as exc:  # surfaced on the next flush()/set_json()
+                self._writer_error = exc
+            finally:
+                for _ in jobs:
+                    self._write_queue.task_done()
+
+    def _flush_batch(self, writes: list[tuple[Path, bytes]]) -> None:
+        if len(writes) == 1:
+            self._atomic_write_bytes(*writes[0])
+            return
+        staged: list[tuple[str, Path]] = []
+        try:
+            for path, payload in writes:
+                fd, temp_path = tempfile.mkstemp(prefix=f".{path.name}.", dir=path.parent)
+                staged.append((temp_path, path))
+                with os.fdopen(fd, "wb") as handle:
+                    handle.write(payload)
+            for temp_path, path in staged:
+                os.replace(temp_path, path)
+        except BaseException:
+            for temp_path, _path in staged:
+                try:
+                    os.unlink(temp_path)
+                except OSError:
+                    pass
+            raise
+
+    def flush(self) -> None:
+        """Block until every deferred write has been persisted."""
+        if self._writer_thread is None:
+            return
+        self._write_queue.join()
+        self._raise_writer_error()
 
     def update_json(
         self,
@@ -322,28 +559,62 @@ class GitNotesStore:
     ) -> Any:
         default_value = {} if default is None else default
         last_error: Exception | None = None
-        for _ in range(4):
-            current = self.get_envelope(namespace, default=default_value)
+        current = self.get_envelope(namespace, default=default_value)
+        for attempt in range(8):
             updated = updater(current.get("data", default_value))
             try:
                 self.set_json(namespace, updated, expected_revision=int(current.get("revision", 1)))
                 return updated
-            except ArchitectStateError as exc:
+            except StateConflictError as exc:
                 last_error = exc
-                if "Concurrent state update detected" not in str(exc):
-                    raise
-                time.sleep(0.01)
+                time.sleep(random.uniform(0, 0.001 * (2**attempt)))
+                current = self._refresh_revision(namespace, exc, default_value)
         raise ArchitectStateError(str(last_error) if last_error else "State update failed.")
 
+    def _refresh_revision(
+        self, namespace: str, conflict: StateConflictError, default: Any
+    ) -> dict[str, Any]:
+        # The conflicting envelope was read under the state lock, so it is at least as fresh
+        # as a re-read; set_json re-validates the revision before anything is written.
+        if conflict.current:
+            return conflict.current
+        return self.get_envelope(namespace, default=default)
+
+    def _get_cached_dict(self, namespace: str) -> dict[str, Any]:
+        # Entries are stored serialized so every caller gets an independent copy to mutate.
+        buffered = self._transaction is not None and namespace in self._transaction
+        entry = None if buffered else self._ttl_cache.get(namespace)
+        if entry is not None and time.monotonic() - entry[0] < self._read_cache_ttl:
+            return loads_json(entry[1])
+        payload = self.get_json(namespace, default={})
+        if not isinstance(payload, dict):
+            return {}
+        if self._read_cache_ttl > 0 and not buffered:
+            self._ttl_cache[namespace] = (time.monotonic(), self._serialize(payload))
+        return payload
+
     def get_context(self) -> dict[str, Any]:
-        context = self.get_json("context", default={})
-        if isinstance(context, dict):
-            return context
-        return {}
+        return self._get_cached_dict("context")
 
     def set_context(self, context: dict[str, Any]) -> None:
         self.set_json("context", context)
 
+    def append_session_patch(self, entry: dict[str, Any]) -> None:
+        """Append one patch entry to ``context.session.patch_stack`` as a delta update."""
+
+        def _updater(payload: Any) -> dict[str, Any]:
+            context = payload if isinstance(payload, dict) else {}
+            session = context.setdefault("session", {})
+            if not isinstance(session, dict):
+                return context
+            stack = session.get("patch_stack")
+            if not isinstance(stack, list):
+                stack = session["patch_stack"] = []
+            stack.append(entry)
+            return context
+
+        self.update_json("context", _updater, default={})
+
     def get_tasks(self) -> list[dict[str, Any]]:
         payload = self.get_json("tasks", default={"task_queue": []})
         if not isinstance(payload, dict):
@@ -366,13 +637,17 @@ class GitNotesStore:
         return []
 
     def add_decision(self, decision: dict[str, Any]) -> None:
+        self.add_decisions([decision])
+
+    def add_decisions(self, decisions: list[dict[str, Any]]) -> None:
         def _updater(payload: Any) -> dict[str, Any]:
             result = payload if isinstance(payload, dict) else {"decisions": []}
             result.setdefault("decisions", [])
-            result["decisions"].append(decision)
+            result["decisions"].extend(decisions)
             return result
 
-        self.update_json("decisions", _updater, default={"decisions": []})
+        if decisions:
+            self.update_json("decisions", _updater, default={"decisions": []})
 
     def get_checkpoints(self) -> list[dict[str, Any]]:
         payload = self.get_json("checkpoints", default={"checkpoints": []})
@@ -392,13 +667,89 @@ class GitNotesStore:
 
         self.update_json("checkpoints", _updater, default={"checkpoints": []})
 
+    @staticmethod
+    def _normalize_metrics(metrics: dict[str, Any]) -> dict[str, Any]:
+        # Patch bookkeeping keys are coerced once on read, so consumers can rely on their
+        # shapes (dicts, and a list of dict entries) without re-checking every item.
+        for key in ("patch_index", "patch_lifecycle"):
+            if key in metrics and not isinstance(metrics[key], dict):
+                metrics[key] = {}
+        stack = metrics.get("patch_stack")
+        if stack is not None:
+            if isinstance(stack, list):
+                metrics["patch_stack"] = [item for item in stack if isinstance(item, dict)]
+            else:
+                metrics["patch_stack"] = []
+        return metrics
+
     def get_metrics(self) -> dict[str, Any]:
-        metrics = self.get_json("metrics", default={})
-        return metrics if isinstance(metrics, dict) else {}
+        return self._normalize_metrics(self._get_cached_dict("metrics"))
 
     def set_metrics(self, metrics: dict[str, Any]) -> None:
         self.set_json("metrics", metrics)
 
+    @staticmethod
+    def _patch_metrics(payload: Any) -> tuple[dict[str, Any], dict, dict, list]:
+        # Normalizes the patch bookkeeping keys so delta updaters can mutate them in place.
+        result = payload if isinstance(payload, dict) else {}
+        if not isinstance(result.get("patch_index"), dict):
+            result["patch_index"] = {}
+        if not isinstance(result.get("patch_lifecycle"), dict):
+            result["patch_lifecycle"] = {}
+        if not isinstance(result.get("patch_stack"), list):
+            result["patch_stack"] = []
+        return result, result["patch_index"], result["patch_lifecycle"], result["patch_stack"]
+
+    def append_patch_stack(self, entry: dict[str, Any]) -> None:
+        self.extend_patch_stack([entry])
+
+    def extend_patch_stack(self, entries: list[dict[str, Any]]) -> None:
+        def _updater(payload: Any) -> dict[str, Any]:
+            result, patch_index, lifecycle, stack = self._patch_metrics(payload)
+            for entry in entries:
+                patch_index[entry["commit_hash"]] = entry["patch_id"]
+                lifecycle[entry["commit_hash"]] = entry.get("status", "pending")
+                stack.append(entry)
+            return result
+
+        if entries:
+            self.update_json("metrics", _updater, default={})
+
+    def set_patch_index(self, commit_hash: str, patch_id: str) -> None:
+        def _updater(payload: Any) -> dict[str, Any]:
+            result, patch_index, _lifecycle, _stack = self._patch_metrics(payload)
+            patch_index[commit_hash] = patch_id
+            return result
+
+        self.update_json("metrics", _updater, default={})
+
+    def set_patch_lifecycle(self, commit_hash: str, status: str, note: str | None = None) -> None:
+        def _updater(payload: Any) -> dict[str, Any]:
+            result, _patch_index, lifecycle, stack = self._patch_metrics(payload)
+            lifecycle[commit_hash] = status
+            now = self._utcnow_iso()
+            for item in stack:
+                if isinstance(item, dict) and item.get("commit_hash") == commit_hash:
+                    item["status"] = status
+                    item["updated_at"] = now
+                    if note:
+                        item["status_note"] = note
+            return result
+
+        self.update_json("metrics", _updater, default={})
+
+    def update_patch_entry(self, commit_hash: str, updates: dict[str, Any]) -> None:
+        def _updater(payload: Any) -> dict[str, Any]:
+            result, _patch_index, _lifecycle, stack = self._patch_metrics(payload)
+            for item in stack:
+                if isinstance(item, dict) and item.get("commit_hash") == commit_hash:
+                    item.update(updates)
+                    item["updated_at"] = self._utcnow_iso()
+                    break
+            return result
+
+        self.update_json("metrics", _updater, default={})
+
     def get_leases(self) -> dict[str, Any]:
         leases = self.get_json("leases", default={})
         return leases if isinstance(leases, dict) else {}
@@ -1,17 +1,39 @@
 from __future__ import annotations
 
-import fnmatch
 import json
 import re
+import shutil
 import subprocess
+import threading
+import time
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 from uuid import uuid4
 
+try:
+    import pygit2
+except ImportError:  # optional in-process reader; see the `libgit2` extra
+    pygit2 = None
+
+from architect.globs import compile_globs
+from architect.jsonio import dumps_json, loads_json
 from architect.state.git_notes import ArchitectStateError, GitNotesStore
 
+_SANITIZE_RE = re.compile(r"[^a-zA-Z0-9._-]+")
+
+
+def _utc_ts() -> str:
+    # Same text as datetime.now(UTC).replace(microsecond=0).isoformat(), without the
+    # intermediate datetime objects.
+    t = time.gmtime()
+    return (
+        f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}"
+        f"T{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}+00:00"
+    )
+
 
 @dataclass(slots=True)
 class Patch:
@@ -34,12 +56,42 @@ class Patch:
 
 
 class PatchStackManager:
-    def __init__(self, repo_root: Path, state_store: GitNotesStore | None = None) -> None:
+    # Non-hex marker echoed back verbatim by `git diff-tree --stdin` to delimit each answer.
+    _DIFF_TREE_SENTINEL = "::architect-diff-tree-end::"
+    _GIT = shutil.which("git") or "git"
+    # Matches the default unprivileged /proc/sys/fs/pipe-max-size on Linux.
+    _PIPE_SIZE = 1 << 20
+
+    def __init__(
+        self,
+        repo_root: Path,
+        state_store: GitNotesStore | None = None,
+        *,
+        write_commit_graph: bool = False,
+    ) -> None:
         self.repo_root = repo_root.resolve()
+        # Absolute git plus `-C` (no cwd=, preexec_fn or close_fds sweep) lets subprocess take
+        # the posix_spawn path instead of fork+exec.
+        self._git_prefix = (self._GIT, "-C", str(self.repo_root), "--no-pager")
         self.state_store = state_store
         self.local_checkpoints_file = self.repo_root / ".architect" / "checkpoints.json"
         self.local_checkpoints_file.parent.mkdir(parents=True, exist_ok=True)
         self._git_enabled = self._is_git_repo()
+        # Commits are content-addressed, so their file lists never need invalidation.
+        self._changed_files_cache: dict[str, list[str]] = {}
+        self._diff_tree_proc: subprocess.Popen[bytes] | None = None
+        # Commit hashes already confirmed present in the persisted patch indexes.
+        self._last_indexed_hashes: frozenset[str] = frozenset()
+        self._diff_tree_lock = threading.Lock()
+        self._libgit2_repo = self._open_libgit2_repo() if self._git_enabled else None
+        self._commit_graph_thread: threading.Thread | None = None
+        if self._git_enabled and write_commit_graph:
+            self._commit_graph_thread = threading.Thread(
+                target=self._write_commit_graph,
+                name="architect-commit-graph",
+                daemon=True,
+            )
+            self._commit_graph_thread.start()
 
     @property
     def git_enabled(self) -> bool:
@@ -47,8 +99,8 @@ class PatchStackManager:
 
     def _is_git_repo(self) -> bool:
         proc = subprocess.run(
-            ["git", "--no-pager", "rev-parse", "--is-inside-work-tree"],
-            cwd=self.repo_root,
+            [*self._git_prefix, "rev-parse", "--is-inside-work-tree"],
+            close_fds=False,
             text=True,
             capture_output=True,
         )
@@ -60,8 +112,8 @@ class PatchStackManager:
                 "No git repository found. Git patch-stack operations are disabled."
             )
         proc = subprocess.run(
-            ["git", "--no-pager", *args],
-            cwd=self.repo_root,
+            [*self._git_prefix, *args],
+            close_fds=False,
             text=True,
             capture_output=True,
         )
@@ -69,13 +121,182 @@ class PatchStackManager:
             raise ArchitectStateError(proc.stderr.strip() or proc.stdout.strip())
         return proc
 
+    def _run_git_bytes(
+        self, args: list[str], check: bool = True
+    ) -> subprocess.CompletedProcess[bytes]:
+        if not self.git_enabled:
+            raise ArchitectStateError(
+                "No git repository found. Git patch-stack operations are disabled."
+            )
+        # Large outputs (log walks, diffstats) are read as bytes through enlarged pipes so
+        # git blocks on fewer buffer flushes and no text decode happens up front.
+        try:
+            proc = subprocess.run(
+                [*self._git_prefix, *args],
+                close_fds=False,
+                capture_output=True,
+                pipesize=self._PIPE_SIZE,
+            )
+        except PermissionError:
+            # pipe-max-size was lowered below our request; default-sized pipes still work.
+            proc = subprocess.run([*self._git_prefix, *args], close_fds=False, capture_output=True)
+        if check and proc.returncode != 0:
+            message = proc.stderr.strip() or proc.stdout.strip()
+            raise ArchitectStateError(message.decode("utf-8", errors="replace"))
+        return proc
+
+    def _open_libgit2_repo(self) -> Any:
+        # Read-only lookups use libgit2 in-process when pygit2 is installed; mutations keep
+        # going through the git CLI so hooks, config and index semantics stay identical.
+        if pygit2 is None:
+            return None
+        try:
+            discovered = pygit2.discover_repository(str(self.repo_root))
+            return pygit2.Repository(discovered) if discovered else None
+        except (pygit2.GitError, ValueError):
+            return None
+
+    def _libgit2_changed_files(self, commit_hash: str) -> list[str] | None:
+        repo = self._libgit2_repo
+        if repo is None:
+            return None
+        with self._diff_tree_lock:
+            try:
+                commit = repo.get(commit_hash)
+                if commit is None or commit.type != pygit2.GIT_OBJECT_COMMIT:
+                    return None
+                if len(commit.parents) > 1:
+                    return None  # combined merge diffs are left to git.
+                if commit.parents:
+                    diff = commit.parents[0].tree.diff_to_tree(commit.tree)
+                else:
+                    diff = commit.tree.diff_to_tree(swap=True)
+                diff.find_similar()
+                return [delta.new_file.path for delta in diff.deltas]
+            except (pygit2.GitError, KeyError, ValueError):
+                return None
+
+    def _write_commit_graph(self) -> None:
+        # Opt-in, best effort: a commit-graph (with changed-path Bloom filters) speeds up the
+        # history walks behind list_patches and reject_patch. It is only seeded when the
+        # repository has none, as a split graph, so starts never rewrite an existing graph;
+        # keeping it current is left to git's own maintenance.
+        try:
+            proc = subprocess.run(
+                [
+                    *self._git_prefix,
+                    "rev-parse",
+                    "--git-path",
+                    "objects/info/commit-graph",
+                    "--git-path",
+                    "objects/info/commit-graphs/commit-graph-chain",
+                ],
+                close_fds=False,
+                text=True,
+                capture_output=True,
+            )
+            if proc.returncode != 0:
+                return
+            graph_paths = [self.repo_root / line for line in proc.stdout.splitlines() if line]
+            if not graph_paths or any(path.exists() for path in graph_paths):
+                return
+            subprocess.run(
+                [
+                    *self._git_prefix,
+                    "commit-graph",
+                    "write",
+                    "--reachable",
+                    "--split",
+                    "--changed-paths",
+                    "--no-progress",
+                ],
+                close_fds=False,
+                text=True,
+                capture_output=True,
+            )
+        except OSError:
+            return
+
+    def _diff_tree_files(self, commit_hash: str) -> list[str] | None:
+        # A long-lived `diff-tree --stdin` answers repeated lookups without paying git's
+        # startup cost per commit; None tells the caller to fall back to `git show`. Output is
+        # NUL-delimited ("<hash>\0<path>\0..."), so paths are never C-quoted; the sentinel
+        # line, which diff-tree echoes back, ends each answer.
+        end_marker = f"{self._DIFF_TREE_SENTINEL}\n".encode("ascii")
+        with self._diff_tree_lock:
+            try:
+                proc = self._diff_tree_proc
+                if proc is None or proc.poll() is not None:
+                    proc = subprocess.Popen(
+                        [
+                            *self._git_prefix,
+                            "diff-tree",
+                            "--stdin",
+                            "-z",
+                            "-r",
+                            "--root",
+                            "-M",
+                            "--name-only",
+                        ],
+                        close_fds=False,
+                        stdin=subprocess.PIPE,
+                        stdout=subprocess.PIPE,
+                        stderr=subprocess.DEVNULL,
+                    )
+                    self._diff_tree_proc = proc
+                if proc.stdin is None or proc.stdout is None:
+                    raise OSError("git diff-tree pipes are unavailable")
+                proc.stdin.write(f"{commit_hash}\n".encode("ascii") + end_marker)
+                proc.stdin.flush()
+                # Paths may contain newlines, so lines are accumulated until the buffer ends
+                # with the sentinel as its own record.
+                buffer = bytearray()
+                while True:
+                    chunk = proc.stdout.readline()
+                    if not chunk:
+                        raise OSError("git diff-tree exited unexpectedly")
+                    buffer += chunk
+                    if buffer == end_marker or buffer.endswith(b"\x00" + end_marker):
+                        break
+            except OSError:
+                self._close_diff_tree()
+                return None
+        fields = bytes(buffer[: -len(end_marker)]).split(b"\x00")
+        if fields and fields[0] == commit_hash.encode("ascii"):
+            fields = fields[1:]
+        return [field.decode("utf-8", errors="replace") for field in fields if field]
+
+    def _close_diff_tree(self) -> None:
+        proc, self._diff_tree_proc = self._diff_tree_proc, None
+        if proc is None:
+            return
+        if proc.stdin is not None:
+            try:
+                proc.stdin.close()
+            except OSError:
+                pass
+        try:
+            proc.wait(timeout=1)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+        if proc.stdout is not None:
+            proc.stdout.close()
+
+    def close(self) -> None:
+        """Stop helper git processes started by this manager."""
+        with self._diff_tree_lock:
+            self._close_diff_tree()
+
+    def __del__(self) -> None:
+        try:
+            self._close_diff_tree()
+        except Exception:
+            pass
+
     @staticmethod
-    def _matches_forbidden_path(path: str, patterns: list[str]) -> str | None:
-        normalized = path.replace("\\", "/")
-        for pattern in patterns:
-            if fnmatch.fnmatch(normalized, pattern):
-                return pattern
-        return None
+    def _matches_forbidden_path(path: str, patterns: Sequence[str]) -> str | None:
+        return compile_globs(patterns).first_match(path)
 
     @staticmethod
     def _patch_id_for_commit(commit_hash: str) -> str:
@@ -91,31 +312,24 @@ class PatchStackManager:
             return
         self.state_store.set_metrics(metrics)
 
-    def _ensure_patch_indexes(self, patches: list[Patch]) -> None:
+    def _ensure_patch_indexes(
+        self, patches: list[Patch], metrics: dict[str, Any] | None = None
+    ) -> None:
         if self.state_store is None:
             return
-        metrics = self._metrics()
+        current = frozenset(patch.commit_hash for patch in patches)
+        if current <= self._last_indexed_hashes:
+            return
+        # Callers that already parsed the metrics envelope pass it in to avoid a second read.
+        if metrics is None:
+            metrics = self._metrics()
+        # get_metrics() already normalized these keys to their expected shapes.
         patch_index = metrics.get("patch_index", {})
         lifecycle = metrics.get("patch_lifecycle", {})
         patch_stack = metrics.get("patch_stack", [])
         changed = False
-
-        if not isinstance(patch_index, dict):
-            patch_index = {}
-            changed = True
-        if not isinstance(lifecycle, dict):
-            lifecycle = {}
-            changed = True
-        if not isinstance(patch_stack, list):
-            patch_stack = []
-            changed = True
-
-        existing_stack_hashes = {
-            item.get("commit_hash")
-            for item in patch_stack
-            if isinstance(item, dict) and isinstance(item.get("commit_hash"), str)
-        }
-        now = datetime.now(UTC).replace(microsecond=0).isoformat()
+        existing_stack_hashes = {item.get("commit_hash") for item in patch_stack}
+        now = _utc_ts()
 
         for patch in patches:
             if patch.commit_hash not in patch_index:
@@ -133,7 +347,8 @@ class PatchStackManager:
                         "status": patch.status,
                         "task_id": patch.task_id,
                         "created_at": now,
-                        "files_changed": patch.files_changed,
+                        "files_changed": patch.files_changed
+                        or self.changed_files_for_commit(patch.commit_hash),
                     }
                 )
                 changed = True
@@ -143,13 +358,32 @@ class PatchStackManager:
             metrics["patch_lifecycle"] = lifecycle
             metrics["patch_stack"] = patch_stack
             self._set_metrics(metrics)
+        self._last_indexed_hashes |= current
 
     def current_branch(self) -> str:
         if not self.git_enabled:
             return "no-git"
+        repo = self._libgit2_repo
+        if repo is not None:
+            try:
+                return "HEAD" if repo.head_is_detached else repo.head.shorthand
+            except pygit2.GitError:
+                pass  # unborn HEAD and similar cases report through the CLI below.
         proc = self._run_git(["rev-parse", "--abbrev-ref", "HEAD"], check=True)
         return proc.stdout.strip()
 
+    def head_commit(self) -> str:
+        if not self.git_enabled:
+            return ""
+        repo = self._libgit2_repo
+        if repo is not None:
+            try:
+                return str(repo.head.target)
+            except pygit2.GitError:
+                pass  # unborn HEAD falls through to the CLI, which reports it as empty.
+        proc = self._run_git(["rev-parse", "--verify", "-q", "HEAD"], check=False)
+        return proc.stdout.strip() if proc.returncode == 0 else ""
+
     def create_branch(self, branch_name: str, start_point: str = "HEAD") -> None:
         self._run_git(["checkout", "-B", branch_name, start_point], check=True)
 
@@ -157,16 +391,13 @@ class PatchStackManager:
         self,
         base_ref: str | None = None,
         commit_hashes: set[str] | None = None,
+        *,
+        include_files: bool = True,
     ) -> list[Patch]:
         if not self.git_enabled:
             metrics = self._metrics()
-            stack = metrics.get("patch_stack", [])
-            if not isinstance(stack, list):
-                return []
             patches: list[Patch] = []
-            for item in stack:
-                if not isinstance(item, dict):
-                    continue
+            for item in metrics.get("patch_stack", []):
                 commit_hash = item.get("commit_hash")
                 patch_id = item.get("patch_id")
                 if not isinstance(commit_hash, str) or not isinstance(patch_id, str):
@@ -191,57 +422,58 @@ class PatchStackManager:
                 )
             return patches
         range_part = f"{base_ref}..HEAD" if base_ref else "HEAD"
-        proc = self._run_git(
-            ["log", "--reverse", "--pretty=format:%H%x09%s", range_part],
+        # One NUL-delimited log walk yields every commit header plus its changed files. Each
+        # block is "\x01<hash>\0<subject>[\n<file>\0...]", split on raw bytes; only subjects
+        # and paths are decoded.
+        # Without include_files the tree diffs are skipped and files_changed is left empty.
+        name_only = ["--name-only"] if include_files else []
+        proc = self._run_git_bytes(
+            ["log", "--reverse", "-z", *name_only, "--pretty=format:%x01%H%x00%s", range_part],
             check=False,
         )
         if proc.returncode != 0 or not proc.stdout.strip():
             return []
 
         metrics = self._metrics()
-        patch_index = (
-            metrics.get("patch_index", {}) if isinstance(metrics.get("patch_index"), dict) else {}
-        )
-        lifecycle = (
-            metrics.get("patch_lifecycle", {})
-            if isinstance(metrics.get("patch_lifecycle"), dict)
-            else {}
-        )
+        patch_index = metrics.get("patch_index", {})
+        lifecycle = metrics.get("patch_lifecycle", {})
         task_map: dict[str, str] = {}
-        patch_stack = metrics.get("patch_stack", [])
-        if isinstance(patch_stack, list):
-            for item in patch_stack:
-                if isinstance(item, dict):
-                    commit_hash = item.get("commit_hash")
-                    task_id = item.get("task_id")
-                    if isinstance(commit_hash, str) and isinstance(task_id, str):
-                        task_map[commit_hash] = task_id
+        for item in metrics.get("patch_stack", []):
+            commit_hash = item.get("commit_hash")
+            task_id = item.get("task_id")
+            if isinstance(commit_hash, str) and isinstance(task_id, str):
+                task_map[commit_hash] = task_id
 
         patches: list[Patch] = []
-        for _index, line in enumerate(proc.stdout.splitlines(), start=1):
-            commit_hash, _, subject = line.partition("\t")
-            commit_hash = commit_hash.strip()
+        for block in proc.stdout.split(b"\x01"):
+            if not block:
+                continue
+            raw_hash, _, rest = block.partition(b"\x00")
+            raw_subject, _, file_block = rest.partition(b"\n")
+            commit_hash = raw_hash.decode("ascii")
             if commit_hashes is not None and commit_hash not in commit_hashes:
                 continue
-            patch_id = patch_index.get(commit_hash) if isinstance(patch_index, dict) else None
+            patch_id = patch_index.get(commit_hash)
             if not isinstance(patch_id, str) or not patch_id:
                 patch_id = self._patch_id_for_commit(commit_hash)
-            status = "pending"
-            if isinstance(lifecycle, dict):
-                status = str(lifecycle.get(commit_hash, "pending"))
-            files_changed = self.changed_files_for_commit(commit_hash)
+            status = str(lifecycle.get(commit_hash, "pending"))
+            files_changed = [
+                path.decode("utf-8", errors="replace") for path in file_block.split(b"\x00") if path
+            ]
+            if include_files:
+                self._changed_files_cache[commit_hash] = files_changed
             patches.append(
                 Patch(
                     patch_id=patch_id,
                     commit_hash=commit_hash,
-                    subject=subject.strip(),
+                    subject=raw_subject.rstrip(b"\x00").decode("utf-8", errors="replace").strip(),
                     status=status,
                     task_id=task_map.get(commit_hash),
-                    files_changed=files_changed,
+                    files_changed=list(files_changed),
                 )
             )
 
-        self._ensure_patch_indexes(patches)
+        self._ensure_patch_indexes(patches, metrics)
 
         # Backward compatibility with legacy positional IDs
         for index, patch in enumerate(patches, start=1):
@@ -258,14 +490,23 @@ class PatchStackManager:
         base_ref: str | None = None,
         commit_hashes: set[str] | None = None,
     ) -> Patch | None:
-        patches = self.list_patches(base_ref=base_ref, commit_hashes=commit_hashes)
+        # Only the resolved patch needs its file list, so the log walk skips tree diffs and
+        # the winner's files are loaded afterwards (usually from the per-commit cache).
+        patches = self.list_patches(
+            base_ref=base_ref, commit_hashes=commit_hashes, include_files=not self.git_enabled
+        )
+        resolved = self._match_patch(patches, patch_ref)
+        if resolved is not None and self.git_enabled:
+            resolved.files_changed = self.changed_files_for_commit(resolved.commit_hash)
+        return resolved
 
+    @staticmethod
+    def _match_patch(patches: list[Patch], patch_ref: str) -> Patch | None:
+        exact = {patch.patch_id: patch for patch in patches}.get(patch_ref)
+        if exact is not None:
+            return exact
         for patch in patches:
-            if patch.patch_id == patch_ref:
-                return patch
-            if patch.commit_hash.startswith(patch_ref):
-                return patch
-            if patch.patch_id.startswith(patch_ref):
+            if patch.commit_hash.startswith(patch_ref) or patch.patch_id.startswith(patch_ref):
                 return patch
 
         # Legacy positional reference support (e.g. patch-001).
@@ -277,13 +518,7 @@ class PatchStackManager:
 
     def changed_files_for_commit(self, commit_hash: str) -> list[str]:
         if not self.git_enabled:
-            metrics = self._metrics()
-            stack = metrics.get("patch_stack", [])
-            if not isinstance(stack, list):
-                return []
-            for item in stack:
-                if not isinstance(item, dict):
-                    continue
+            for item in self._metrics().get("patch_stack", []):
                 if item.get("commit_hash") != commit_hash:
                     continue
                 files_changed = item.get("files_changed", [])
@@ -291,6 +526,17 @@ class PatchStackManager:
                     return []
                 return [str(path) for path in files_changed]
             return []
+        cached = self._changed_files_cache.get(commit_hash)
+        if cached is not None:
+            return list(cached)
+        # Only full object names are immutable; symbolic refs such as HEAD can move.
+        if re.fullmatch(r"[0-9a-f]{40}|[0-9a-f]{64}", commit_hash):
+            files = self._libgit2_changed_files(commit_hash)
+            if files is None:
+                files = self._diff_tree_files(commit_hash)
+            if files is not None:
+                self._changed_files_cache[commit_hash] = files
+                return list(files)
         proc = self._run_git(["show", "--pretty=format:", "--name-only", commit_hash], check=False)
         if proc.returncode != 0:
             return []
@@ -311,11 +557,11 @@ class PatchStackManager:
                     files or "- (none)",
                 ]
             )
-        proc = self._run_git(
+        proc = self._run_git_bytes(
             ["show", "--stat", "--pretty=format:%H%n%s%n%b", patch.commit_hash],
             check=True,
         )
-        return proc.stdout.strip()
+        return proc.stdout.strip().decode("utf-8", errors="replace")
 
     def record_patch(
         self,
@@ -326,29 +572,26 @@ class PatchStackManager:
         status: str = "pending",
         run_id: str | None = None,
     ) -> Patch:
-        patch = Patch(
-            patch_id=self._patch_id_for_commit(commit_hash),
-            commit_hash=commit_hash,
-            subject=subject,
-            status=status,
-            task_id=task_id,
-            files_changed=self.changed_files_for_commit(commit_hash),
-        )
-        if self.state_store is not None:
-            metrics = self.state_store.get_metrics()
-            patch_index = metrics.get("patch_index", {})
-            lifecycle = metrics.get("patch_lifecycle", {})
-            stack = metrics.get("patch_stack", [])
-            if not isinstance(patch_index, dict):
-                patch_index = {}
-            if not isinstance(lifecycle, dict):
-                lifecycle = {}
-            if not isinstance(stack, list):
-                stack = []
-
-            patch_index[commit_hash] = patch.patch_id
-            lifecycle[commit_hash] = status
-            stack.append(
+        return self.record_patches([(commit_hash, subject, task_id, status, run_id)])[0]
+
+    def record_patches(
+        self, entries: Iterable[tuple[str, str, str, str, str | None]]
+    ) -> list[Patch]:
+        """Record (commit_hash, subject, task_id, status, run_id) tuples with one state write."""
+        now = _utc_ts()
+        patches: list[Patch] = []
+        stack_entries: list[dict[str, Any]] = []
+        for commit_hash, subject, task_id, status, run_id in entries:
+            patch = Patch(
+                patch_id=self._patch_id_for_commit(commit_hash),
+                commit_hash=commit_hash,
+                subject=subject,
+                status=status,
+                task_id=task_id,
+                files_changed=self.changed_files_for_commit(commit_hash),
+            )
+            patches.append(patch)
+            stack_entries.append(
                 {
                     "patch_id": patch.patch_id,
                     "commit_hash": commit_hash,
@@ -356,64 +599,23 @@ class PatchStackManager:
                     "status": status,
                     "task_id": task_id,
                     "run_id": run_id,
-                    "created_at": datetime.now(UTC).replace(microsecond=0).isoformat(),
+                    "created_at": now,
                     "files_changed": patch.files_changed,
                 }
             )
-            metrics["patch_index"] = patch_index
-            metrics["patch_lifecycle"] = lifecycle
-            metrics["patch_stack"] = stack
-            self.state_store.set_metrics(metrics)
-        return patch
+        if self.state_store is not None:
+            self.state_store.extend_patch_stack(stack_entries)
+        return patches
 
     def update_patch_status(self, commit_hash: str, status: str, note: str | None = None) -> None:
         if self.state_store is None:
             return
-        metrics = self.state_store.get_metrics()
-        lifecycle = metrics.get("patch_lifecycle", {})
-        stack = metrics.get("patch_stack", [])
-        if not isinstance(lifecycle, dict):
-            lifecycle = {}
-        if not isinstance(stack, list):
-            stack = []
-
-        lifecycle[commit_hash] = status
-        now = datetime.now(UTC).replace(microsecond=0).isoformat()
-        for item in stack:
-            if not isinstance(item, dict):
-                continue
-            if item.get("commit_hash") == commit_hash:
-                item["status"] = status
-                item["updated_at"] = now
-                if note:
-                    item["status_note"] = note
-
-        metrics["patch_lifecycle"] = lifecycle
-        metrics["patch_stack"] = stack
-        self.state_store.set_metrics(metrics)
+        self.state_store.set_patch_lifecycle(commit_hash, status, note=note)
 
     def update_patch_metadata(self, commit_hash: str, updates: dict[str, Any]) -> None:
         if self.state_store is None:
             return
-        metrics = self.state_store.get_metrics()
-        stack = metrics.get("patch_stack", [])
-        if not isinstance(stack, list):
-            return
-
-        changed = False
-        for item in stack:
-            if not isinstance(item, dict):
-                continue
-            if item.get("commit_hash") != commit_hash:
-                continue
-            item.update(updates)
-            item["updated_at"] = datetime.now(UTC).replace(microsecond=0).isoformat()
-            changed = True
-            break
-
-        if changed:
-            metrics["patch_stack"] = stack
-            self.state_store.set_metrics(metrics)
+        self.state_store.update_patch_entry(commit_hash, updates)
 
     def create_task_patch(
         self, artifact_path: Path, *, subject: str, body: str, task_id: str, run_id: str
@@ -437,7 +639,7 @@ class PatchStackManager:
         staged_files: list[str],
         *,
         max_files: int | None,
-        forbidden_paths: list[str] | None,
+        forbidden_paths: Sequence[str] | None,
     ) -> None:
         if max_files is not None and len(staged_files) > max_files:
             raise ArchitectStateError(
@@ -464,8 +666,8 @@ class PatchStackManager:
         fallback_content: str | None = None,
         fallback_mode: str = "tracked",
         max_files: int | None = None,
-        forbidden_paths: list[str] | None = None,
-        exclude_paths: list[str] | None = None,
+        forbidden_paths: Sequence[str] | None = None,
+        exclude_paths: Sequence[str] | None = None,
     ) -> Patch:
         if not self.git_enabled:
             raise ArchitectStateError("Creating a patch requires a git repository.")
@@ -538,20 +740,7 @@ class PatchStackManager:
         if self.state_store is None:
             return patch
 
-        metrics = self.state_store.get_metrics()
-        patch_index = metrics.get("patch_index", {})
-        lifecycle = metrics.get("patch_lifecycle", {})
-        stack = metrics.get("patch_stack", [])
-        if not isinstance(patch_index, dict):
-            patch_index = {}
-        if not isinstance(lifecycle, dict):
-            lifecycle = {}
-        if not isinstance(stack, list):
-            stack = []
-
-        patch_index[commit_hash] = patch.patch_id
-        lifecycle[commit_hash] = "pending"
-        stack.append(
+        self.state_store.append_patch_stack(
             {
                 "patch_id": patch.patch_id,
                 "commit_hash": patch.commit_hash,
@@ -559,15 +748,11 @@ class PatchStackManager:
                 "status": patch.status,
                 "task_id": patch.task_id,
                 "run_id": run_id,
-                "created_at": datetime.now(UTC).replace(microsecond=0).isoformat(),
+                "created_at": _utc_ts(),
                 "files_changed": patch.files_changed,
                 "local": True,
             }
         )
-        metrics["patch_index"] = patch_index
-        metrics["patch_lifecycle"] = lifecycle
-        metrics["patch_stack"] = stack
-        self.state_store.set_metrics(metrics)
         return patch
 
     def reject_patch(
@@ -617,7 +802,7 @@ class PatchStackManager:
         if not self.local_checkpoints_file.exists():
             return []
         try:
-            payload = json.loads(self.local_checkpoints_file.read_text(encoding="utf-8"))
+            payload = loads_json(self.local_checkpoints_file.read_bytes())
         except json.JSONDecodeError:
             return []
         checkpoints = payload.get("checkpoints", [])
@@ -627,15 +812,11 @@ class PatchStackManager:
 
     def _write_local_checkpoints(self, checkpoints: list[str]) -> None:
         payload: dict[str, Any] = {"checkpoints": checkpoints}
-        self.local_checkpoints_file.write_text(
-            json.dumps(payload, ensure_ascii=False, indent=2),
-            encoding="utf-8",
-        )
+        self.local_checkpoints_file.write_bytes(dumps_json(payload, indent=True))
 
     @staticmethod
     def _sanitize_checkpoint_name(name: str) -> str:
-        safe = re.sub(r"[^a-zA-Z0-9._-]+", "-", name.strip().lower())
-        return safe or "checkpoint"
+        return _SANITIZE_RE.sub("-", name.strip().lower()) or "checkpoint"
 
     def create_checkpoint(self, name: str | None = None) -> str:
         timestamp = datetime.now(UTC).strftime("%Y%m%d%H%M%S")
@@ -686,7 +867,7 @@ class PatchStackManager:
             "strategy": strategy,
             "tag": tag_name,
             "commit_hash": patch.commit_hash,
-            "finalized_at": datetime.now(UTC).replace(microsecond=0).isoformat(),
+            "finalized_at": _utc_ts(),
         }
 
         if strategy == "single_branch_queue":
@@ -1,20 +1,30 @@
 from __future__ import annotations
 
 import asyncio
-import fnmatch
+import hashlib
+import heapq
 import importlib.util
+import itertools
 import json
+import random
 import re
 import shlex
+import shutil
 import subprocess
+import tempfile
 import time
-from dataclasses import asdict, dataclass, field
+from collections.abc import Awaitable, Collection, Coroutine, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, suppress
+from dataclasses import dataclass, field, fields
 from datetime import UTC, datetime
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Any
 from uuid import uuid4
 
 from architect.config import ArchitectConfig
+from architect.globs import GlobSet, compile_globs
 from architect.specialists.base import SpecialistAgent, SpecialistResponse
 from architect.state.git_notes import ArchitectStateError, GitNotesStore
 from architect.state.patches import Patch, PatchStackManager
@@ -22,17 +32,91 @@ from architect.state.patches import Patch, PatchStackManager
 SEVERITY_PATTERN = re.compile(r"\b(BLOCKER|MAJOR|MINOR|SUGGESTION)\b", re.IGNORECASE)
 COVERAGE_PATTERN = re.compile(r"\b(\d{1,3})%\b")
 SHELL_REQUIRED_PATTERN = re.compile(r"(?:\|\||&&|[|;<>`]|[$]\()")
-TOOL_POLICY_ALLOWLIST = {
-    "read_file",
-    "write_file",
-    "edit_file",
-    "run_command",
-    "search",
+# Every SHELL_REQUIRED_PATTERN match starts with one of these characters.
+_SHELL_META = frozenset("|;<>`$&")
+_JSON_DECODER = json.JSONDecoder()
+_RELOADABLE_TASK_STATUSES = frozenset({"pending", "in_progress", "failed"})
+_MODIFY_TASK_PREFIXES = ("task-modify-", "task-retry-")
+_REQUIRED_TASK_KEYS = ("id", "type", "assigned_to", "description")
+_MISSING = object()
+_TEST_SEGMENTS = frozenset({"tests", "test", "__tests__", "spec", "specs"})
+# Task types that produce a patch (and therefore mutate the git worktree).
+_PATCH_TASK_TYPES = frozenset({"implement", "document"})
+_NEXT_PHASE = {
+    "plan": "implementation",
+    "implement": "implementation",
+    "test": "review",
+    "review": "documentation",
+    "document": "complete",
 }
+PLAN_BULLET_PATTERN = re.compile(r"^(?:[-*]|\d+[.)])\s+(.+)$")
+PLAN_SENTENCE_SPLIT_PATTERN = re.compile(r"[\n\.]")
+_PLAN_SIGNAL_TOKENS = {
+    "has_interface": ("interface", "boundary", "api"),
+    "has_risks": ("risk", "mitigation", "tradeoff"),
+    "has_analysis": ("analysis", "problem", "context"),
+    "has_milestones": ("milestone", "phase", "step"),
+}
+TOOL_POLICY_ALLOWLIST = frozenset(
+    {
+        "read_file",
+        "write_file",
+        "edit_file",
+        "run_command",
+        "search",
+    }
+)
+
+
+@lru_cache(maxsize=128)
+def _normalize_tool_names(tools: tuple[str, ...]) -> tuple[str, ...]:
+    # Specialists reuse a handful of tool policies, so normalized results are memoized.
+    normalized = tuple(sorted({tool.strip() for tool in tools if tool.strip()}))
+    unknown = sorted(frozenset(normalized) - TOOL_POLICY_ALLOWLIST)
+    if unknown:
+        raise RuntimeError("Tool policy rejected unknown tools: " + ", ".join(unknown))
+    return normalized
+
+
+# Default tool policy per task type, normalized once at import.
+_DEFAULT_TASK_TOOLS: dict[str, tuple[str, ...]] = {
+    task_type: _normalize_tool_names(tools)
+    for task_type, tools in {
+        "implement": ("read_file", "write_file", "edit_file", "run_command", "search"),
+        "test": ("read_file", "run_command"),
+        "review": ("read_file", "run_command", "search"),
+        "document": ("read_file", "write_file", "edit_file", "search"),
+    }.items()
+}
+
+
+@lru_cache(maxsize=4096)
+def _normalized_review_path(path: str) -> str:
+    # Every path classifier compares against the slash-normalized, lowered path; memoizing it
+    # means each review path is lowered once no matter how many predicates inspect it.
+    return path.replace("\\", "/").lower()
+
+
+@lru_cache(maxsize=64)
+def _split_command(command: str) -> tuple[str, ...]:
+    # Preflight and every gate run tokenize the same few configured commands; shlex is slow
+    # enough that the split is memoized. ValueError propagates and is not cached.
+    return tuple(shlex.split(command))
+
+
+_LAST_UTC_ISO: tuple[int, str] = (-1, "")
 
 
 def _utcnow_iso() -> str:
-    return datetime.now(UTC).replace(microsecond=0).isoformat()
+    # Timestamps have second resolution, so the formatted string is reused within a second.
+    global _LAST_UTC_ISO
+    second = int(time.time())
+    cached_second, cached_iso = _LAST_UTC_ISO
+    if second == cached_second:
+        return cached_iso
+    iso = datetime.fromtimestamp(second, UTC).isoformat()
+    _LAST_UTC_ISO = (second, iso)
+    return iso
 
 
 @dataclass(slots=True)
@@ -52,6 +136,18 @@ class WorkTask:
     patch_id: str | None = None
     allowed_tools: list[str] | None = None
 
+    def to_dict(self) -> dict[str, Any]:
+        # Flat attribute reads instead of dataclasses.asdict's recursive deep copy; only the
+        # list fields need fresh copies.
+        payload = {name: getattr(self, name) for name in _TASK_FIELDS}
+        payload["depends_on"] = list(self.depends_on)
+        if self.allowed_tools is not None:
+            payload["allowed_tools"] = list(self.allowed_tools)
+        return payload
+
+
+_TASK_FIELDS = tuple(item.name for item in fields(WorkTask))
+
 
 @dataclass(slots=True)
 class RunSummary:
@@ -64,6 +160,93 @@ class RunSummary:
     checkpoint_id: str | None
 
 
+async def _gather_failfast(coroutines: list[Coroutine[Any, Any, None]]) -> None:
+    # Like asyncio.gather, except the first failure cancels the remaining coroutines and is
+    # re-raised as-is, so callers see the same exception a serial loop would raise.
+    futures = [asyncio.ensure_future(coroutine) for coroutine in coroutines]
+    try:
+        await asyncio.wait(futures, return_when=asyncio.FIRST_EXCEPTION)
+    finally:
+        for future in futures:
+            future.cancel()
+        await asyncio.gather(*futures, return_exceptions=True)
+    for future in futures:
+        error = None if future.cancelled() else future.exception()
+        if error is not None:
+            raise error
+
+
+def _index_tasks(tasks: list[WorkTask]) -> dict[str, WorkTask]:
+    # The first task wins on duplicate ids, as a front-to-back scan would.
+    return {task.id: task for task in reversed(tasks)}
+
+
+class _ReadyQueue:
+    # Incremental ready set for the run loop. Each pending task keeps a count of unmet
+    # dependencies, so a completion only touches its direct dependents instead of rescanning
+    # the whole graph. Ready tasks come out by critical-path rank (longest chain of pending
+    # dependents first), then by position in the task list. Unknown dependency ids are never
+    # completed, so they keep a task blocked.
+
+    def __init__(self, tasks: list[WorkTask]) -> None:
+        self.tasks = tasks
+        completed = {task.id for task in tasks if task.status == "completed"}
+        self._unmet: dict[int, int] = {}
+        self._waiting_on: dict[str, list[int]] = {}
+        children: dict[str, list[int]] = {}
+        for position, task in enumerate(tasks):
+            if task.status != "pending":
+                continue
+            unmet = 0
+            for dependency in dict.fromkeys(task.depends_on):
+                children.setdefault(dependency, []).append(position)
+                if dependency not in completed:
+                    unmet += 1
+                    self._waiting_on.setdefault(dependency, []).append(position)
+            self._unmet[position] = unmet
+        # One reverse pass; exact for the dependency-first lists _create_task_graph builds.
+        self._rank = [0] * len(tasks)
+        for position in range(len(tasks) - 1, -1, -1):
+            below = children.get(tasks[position].id, ())
+            self._rank[position] = 1 + max((self._rank[child] for child in below), default=0)
+        self._heap = [
+            (-self._rank[position], position)
+            for position, unmet in self._unmet.items()
+            if unmet == 0
+        ]
+        heapq.heapify(self._heap)
+
+    def peek(self) -> WorkTask | None:
+        # Entries whose task has since left the pending state are dropped lazily here.
+        while self._heap and self.tasks[self._heap[0][1]].status != "pending":
+            heapq.heappop(self._heap)
+        return self.tasks[self._heap[0][1]] if self._heap else None
+
+    def take(self, limit: int) -> list[WorkTask]:
+        # Pops up to `limit` ready tasks sharing the type of the top-ranked one; entries of
+        # other types are pushed back so they stay queued for a later batch.
+        batch: list[WorkTask] = []
+        skipped: list[tuple[int, int]] = []
+        while self._heap and len(batch) < limit:
+            entry = heapq.heappop(self._heap)
+            task = self.tasks[entry[1]]
+            if task.status != "pending":
+                continue
+            if batch and task.type != batch[0].type:
+                skipped.append(entry)
+                continue
+            batch.append(task)
+        for entry in skipped:
+            heapq.heappush(self._heap, entry)
+        return batch
+
+    def complete(self, task_id: str) -> None:
+        for position in self._waiting_on.pop(task_id, ()):
+            self._unmet[position] -= 1
+            if self._unmet[position] == 0:
+                heapq.heappush(self._heap, (-self._rank[position], position))
+
+
 class Supervisor:
     def __init__(
         self,
@@ -80,7 +263,37 @@ class Supervisor:
         self.config = config
         self.repo_root = repo_root.resolve()
         self.supervisor_agent = supervisor_agent
+        # Same spawn shape as the patch manager: absolute git plus `-C` instead of cwd=.
+        self._git_prefix = (shutil.which("git") or "git", "-C", str(self.repo_root), "--no-pager")
         self._isolated_dirty_paths: list[str] = []
+        self._command_cache: dict[str, bool] = {}
+        # Plan-critic verdicts keyed by a digest of the reviewed plan text; a replan that
+        # reproduces the same plan reuses the earlier verdict instead of another critic call.
+        self._plan_critic_cache: dict[str, dict[str, int]] = {}
+        # status() lists the patch stack once per (metrics revision, HEAD) pair, so
+        # repeated polls between patch or lifecycle changes skip the log walk.
+        self._patches_snapshot: tuple[tuple[int, str], tuple[Patch, ...]] | None = None
+        self._metrics_live: dict[str, Any] | None = None
+        self._metrics_dirty: set[str] = set()
+        # Heartbeats are coalesced in memory and persisted at most once per interval; lease
+        # acquisition and release always write through.
+        self._pending_heartbeat: dict[str, Any] | None = None
+        self._last_heartbeat_flush = 0.0
+        # Lease expiry and the heartbeat flush interval derive from the backend timeout.
+        timeout_seconds = float(config.backend.timeout_seconds)
+        self._lease_ttl = max(30.0, timeout_seconds * 2.0)
+        self._heartbeat_flush_interval = max(5.0, timeout_seconds / 4.0)
+        # Decision ids end in a 32-bit counter seeded randomly once per supervisor, so ids stay
+        # distinct across runs without drawing from the OS RNG for every decision.
+        self._decision_serials = itertools.count(uuid4().int & 0xFFFFFFFF)
+        # Guardrail and evidence globs are fixed once the supervisor is built. The forbidden
+        # patterns are also kept as a tuple, so the patch manager's per-file glob lookups
+        # reuse it rather than copying the list.
+        self._forbidden_paths = tuple(config.guardrails.forbidden_paths)
+        self._forbidden_path_res = compile_globs(config.guardrails.forbidden_paths)
+        self._guardrail_test_res = compile_globs(config.guardrails.require_tests_for)
+        self._review_docs_res = compile_globs(config.workflow.review_docs_patterns)
+        self._review_changelog_res = compile_globs(config.workflow.review_changelog_patterns)
 
     @staticmethod
     def _gate_name(task_type: str) -> str:
@@ -100,14 +313,34 @@ class Supervisor:
             line = raw_line.strip()
             if not line:
                 continue
-            match = re.match(r"^(?:[-*]|\d+[.)])\s+(.+)$", line)
+            match = PLAN_BULLET_PATTERN.match(line)
             if match:
                 steps.append(match.group(1).strip())
         if not steps and content.strip():
-            sentences = [item.strip() for item in re.split(r"[\n\.]", content) if item.strip()]
+            sentences = [
+                item.strip() for item in PLAN_SENTENCE_SPLIT_PATTERN.split(content) if item.strip()
+            ]
             steps = sentences[:6]
         return steps[:24]
 
+    @staticmethod
+    def _count_plan_steps(content: str) -> int:
+        # Same rules and caps as _extract_plan_steps, without building the step strings.
+        count = 0
+        for raw_line in content.splitlines():
+            if PLAN_BULLET_PATTERN.match(raw_line.strip()):
+                count += 1
+                if count == 24:
+                    return count
+        if count or not content.strip():
+            return count
+        for item in PLAN_SENTENCE_SPLIT_PATTERN.split(content):
+            if item.strip():
+                count += 1
+                if count == 6:
+                    break
+        return count
+
     @staticmethod
     def _parse_review_findings(content: str) -> dict[str, int]:
         findings = {"BLOCKER": 0, "MAJOR": 0, "MINOR": 0, "SUGGESTION": 0}
@@ -154,32 +387,38 @@ class Supervisor:
     def _extract_coverage_percent(result: dict[str, Any]) -> int | None:
         stdout_tail = str(result.get("stdout_tail", ""))
         stderr_tail = str(result.get("stderr_tail", ""))
-        output = f"{stdout_tail}\n{stderr_tail}"
-        for payload in Supervisor._extract_json_objects(output):
-            percent = Supervisor._coverage_from_payload(payload)
-            if percent is not None:
-                return percent
-        matches = COVERAGE_PATTERN.findall(output)
-        if not matches:
+        # Both tails are scanned in place (stdout first) rather than joined into one buffer.
+        tails = (stdout_tail, stderr_tail)
+        for tail in tails:
+            for payload in Supervisor._extract_json_objects(tail):
+                percent = Supervisor._coverage_from_payload(payload)
+                if percent is not None:
+                    return percent
+        best = -1
+        for tail in tails:
+            for match in COVERAGE_PATTERN.finditer(tail):
+                best = max(best, int(match.group(1)))
+        if best < 0:
             return None
-        percent = max(int(item) for item in matches)
-        return min(100, max(0, percent))
+        return min(100, best)
 
     @staticmethod
     def _extract_json_objects(raw_text: str) -> list[dict[str, Any]]:
+        # Scan for object starts and let raw_decode consume each candidate in place; this
+        # avoids splitting the buffer into lines and also picks up multi-line objects.
         payloads: list[dict[str, Any]] = []
-        for raw_line in raw_text.splitlines():
-            line = raw_line.strip()
-            if not line:
-                continue
-            if not (line.startswith("{") and line.endswith("}")):
-                continue
+        decode = _JSON_DECODER.raw_decode
+        size = len(raw_text)
+        index = raw_text.find("{")
+        while index != -1:
             try:
-                parsed = json.loads(line)
+                parsed, index = decode(raw_text, index)
             except json.JSONDecodeError:
-                continue
-            if isinstance(parsed, dict):
-                payloads.append(parsed)
+                index = raw_text.find("\n", index) + 1 or size
+            else:
+                if isinstance(parsed, dict):
+                    payloads.append(parsed)
+            index = raw_text.find("{", index)
         return payloads
 
     @staticmethod
@@ -203,17 +442,13 @@ class Supervisor:
         return None
 
     @staticmethod
-    def _matches_forbidden_path(path: str, patterns: list[str]) -> str | None:
-        normalized = path.replace("\\", "/")
-        for pattern in patterns:
-            if fnmatch.fnmatch(normalized, pattern):
-                return pattern
-        return None
+    def _matches_forbidden_path(path: str, patterns: GlobSet) -> str | None:
+        return patterns.first_match(path)
 
     def _run_git(self, args: list[str], check: bool = True) -> subprocess.CompletedProcess[str]:
         proc = subprocess.run(
-            ["git", "--no-pager", *args],
-            cwd=self.repo_root,
+            [*self._git_prefix, *args],
+            close_fds=False,
             text=True,
             capture_output=True,
         )
@@ -221,43 +456,79 @@ class Supervisor:
             raise RuntimeError(proc.stderr.strip() or proc.stdout.strip())
         return proc
 
-    @staticmethod
-    def _status_line_path(status_line: str) -> str:
-        candidate = status_line[3:].strip()
-        if " -> " in candidate:
-            candidate = candidate.split(" -> ", maxsplit=1)[1].strip()
-        return candidate
-
-    def _dirty_worktree_paths(self) -> list[str]:
+    def _dirty_worktree_paths(self, limit: int | None = None) -> tuple[list[str], bool]:
         if not self.patches.git_enabled:
-            return []
-        proc = self._run_git(["status", "--porcelain"], check=True)
-        lines = [line for line in proc.stdout.splitlines() if line.strip()]
-        if not lines:
-            return []
+            return [], False
+        # NUL-delimited porcelain output is streamed and filtered on raw bytes; paths arrive
+        # unquoted and renames/copies list the new path first, followed by one extra record
+        # for the source. With a limit, git is stopped once enough paths have been read.
+        # stderr goes to a temp file so a chatty git can never block on a full pipe while
+        # stdout is still being read.
         dirty_paths: list[str] = []
-        for line in lines:
-            if ".architect/" in line:
-                continue
-            if line.endswith(" architect.toml") or line.endswith("\tarchitect.toml"):
-                continue
-            path = self._status_line_path(line)
-            if not path:
-                continue
-            dirty_paths.append(path)
-        return dirty_paths
+        truncated = False
+        with (
+            tempfile.TemporaryFile() as stderr_file,
+            subprocess.Popen(
+                [*self._git_prefix, "status", "--porcelain", "-z"],
+                close_fds=False,
+                stdout=subprocess.PIPE,
+                stderr=stderr_file,
+            ) as proc,
+        ):
+            for path, source in self._iter_status_records(proc.stdout):
+                if b".architect/" in path or b".architect/" in source:
+                    continue
+                if path == b"architect.toml":
+                    continue
+                if limit is not None and len(dirty_paths) >= limit:
+                    truncated = True
+                    proc.kill()
+                    break
+                dirty_paths.append(path.decode("utf-8", errors="surrogateescape"))
+            returncode = proc.wait()
+            if returncode != 0 and not truncated:
+                stderr_file.seek(0)
+                stderr = stderr_file.read().strip().decode("utf-8", errors="replace")
+                raise RuntimeError(stderr)
+        return dirty_paths, truncated
+
+    @staticmethod
+    def _iter_status_records(stream: Any) -> Iterator[tuple[bytes, bytes]]:
+        pending = b""
+        expect_source: bytes | None = None
+        for chunk in iter(lambda: stream.read1(1 << 16), b""):
+            records = (pending + chunk).split(b"\x00")
+            pending = records.pop()
+            for record in records:
+                if expect_source is not None:
+                    yield expect_source, record
+                    expect_source = None
+                    continue
+                if len(record) < 4:
+                    continue
+                if record[:1] in b"RC" or record[1:2] in b"RC":
+                    expect_source = record[3:]
+                    continue
+                yield record[3:], b""
+        if expect_source is not None:
+            yield expect_source, b""
 
     def _ensure_clean_worktree(self) -> list[str]:
-        dirty_paths = self._dirty_worktree_paths()
+        # Isolation needs every dirty path; the refusal message only previews a few.
+        isolate = self.config.workflow.dirty_worktree_mode == "isolate"
+        dirty_paths, truncated = self._dirty_worktree_paths(None if isolate else 200)
         if not dirty_paths:
             self._isolated_dirty_paths = []
             return []
 
-        if self.config.workflow.dirty_worktree_mode == "isolate":
+        if isolate:
             self._isolated_dirty_paths = sorted(set(dirty_paths))
             return self._isolated_dirty_paths
 
         details = "\n".join(dirty_paths[:20])
+        if truncated or len(dirty_paths) > 20:
+            suffix = "+" if truncated else ""
+            details += f"\n...and {len(dirty_paths) - 20}{suffix} more"
         raise RuntimeError(
             "Refusing to run with dirty worktree. Commit/stash changes first.\n"
             f"Detected:\n{details}"
@@ -266,43 +537,89 @@ class Supervisor:
     def _record_dirty_isolation(self, dirty_paths: list[str]) -> None:
         if not dirty_paths:
             return
-        metrics = self.state.get_metrics()
-        history = metrics.get("dirty_worktree_isolation", [])
-        if not isinstance(history, list):
-            history = []
-        history.append(
-            {
-                "at": _utcnow_iso(),
-                "count": len(dirty_paths),
-                "paths": dirty_paths[:100],
-            }
-        )
-        metrics["dirty_worktree_isolation"] = history[-20:]
-        self.state.set_metrics(metrics)
+        with self._metrics_batch() as metrics:
+            history = metrics.get("dirty_worktree_isolation", [])
+            if not isinstance(history, list):
+                history = []
+            history.append(
+                {
+                    "at": _utcnow_iso(),
+                    "count": len(dirty_paths),
+                    "paths": dirty_paths[:100],
+                }
+            )
+            self._set_metric("dirty_worktree_isolation", history[-20:])
 
     @staticmethod
     def _normalize_tools(allowed_tools: list[str] | None) -> list[str] | None:
         if not allowed_tools:
             return None
-        normalized = sorted({str(tool).strip() for tool in allowed_tools if str(tool).strip()})
-        unknown = [tool for tool in normalized if tool not in TOOL_POLICY_ALLOWLIST]
-        if unknown:
-            raise RuntimeError(
-                "Tool policy rejected unknown tools: "
-                + ", ".join(unknown)
-            )
-        return normalized
+        return list(_normalize_tool_names(tuple(str(tool) for tool in allowed_tools)))
 
     def _command_available(self, executable: str) -> bool:
         if not executable.strip():
             return False
-        check = subprocess.run(
-            ["sh", "-lc", f"command -v {shlex.quote(executable)} >/dev/null 2>&1"],
-            cwd=self.repo_root,
-            text=True,
-            capture_output=True,
-        )
-        return check.returncode == 0
+        cached = self._command_cache.get(executable)
+        if cached is not None:
+            return cached
+        return self._commands_available([executable])[executable]
+
+    def _commands_available(self, executables: list[str]) -> dict[str, bool]:
+        # Probe every executable in one login shell (one answer line per token, in order)
+        # instead of spawning `sh -lc` per command; results are cached for the supervisor.
+        pending = [
+            name
+            for name in dict.fromkeys(executables)
+            if name.strip() and name not in self._command_cache
+        ]
+        # Anything already on this process's PATH resolves without a spawn; only misses are
+        # re-checked in the login shell, whose profile may extend PATH.
+        for name in pending:
+            if shutil.which(name) is not None:
+                self._command_cache[name] = True
+        pending = [name for name in pending if name not in self._command_cache]
+        if pending:
+            # Answers carry a marker so anything a login profile prints is ignored.
+            script = "; ".join(
+                f"if command -v {shlex.quote(name)} >/dev/null 2>&1; "
+                "then echo architect-probe=1; else echo architect-probe=0; fi"
+                for name in pending
+            )
+            check = subprocess.run(
+                ["sh", "-lc", script],
+                cwd=self.repo_root,
+                text=True,
+                capture_output=True,
+            )
+            results = [
+                line.removeprefix("architect-probe=")
+                for line in check.stdout.splitlines()
+                if line.startswith("architect-probe=")
+            ]
+            for position, name in enumerate(pending):
+                self._command_cache[name] = (
+                    position < len(results) and results[position] == "1"
+                )
+        return {name: self._command_cache.get(name, False) for name in executables}
+
+    def _preflight_executables(self) -> list[str]:
+        executables = [
+            "codex" if backend_name in {"codex", "codex_sdk", "auto"} else backend_name
+            for backend_name in (self.config.backend.primary, self.config.backend.fallback)
+        ]
+        commands = [self.config.project.type_check_command]
+        if self.config.workflow.auto_lint:
+            commands.append(self.config.project.lint_command)
+        if self.config.workflow.auto_test:
+            commands.append(self.config.project.test_command)
+        for command in commands:
+            try:
+                tokens = _split_command(command)
+            except ValueError:
+                continue
+            if tokens:
+                executables.append(tokens[0])
+        return executables
 
     @staticmethod
     def _backend_probe_result(backend_name: str, *, command_available: bool) -> tuple[bool, str]:
@@ -319,6 +636,20 @@ class Supervisor:
             )
         return False, f"Unsupported backend configured: {backend_name}"
 
+    @cached_property
+    def _requires_backend_probe(self) -> bool:
+        # Agents are fixed once the supervisor is built, so the backend shape is checked once.
+        runtime_backends = [
+            getattr(agent, "backend", None)
+            for agent in [*self.specialists.values(), self.supervisor_agent]
+            if agent is not None
+        ]
+        return any(
+            hasattr(backend, "primary_name") and hasattr(backend, "fallback_name")
+            for backend in runtime_backends
+            if backend is not None
+        )
+
     def _preflight_backend_checks(self) -> list[dict[str, Any]]:
         checks: list[dict[str, Any]] = []
         if self.config.backend.primary == self.config.backend.fallback:
@@ -336,17 +667,7 @@ class Supervisor:
                 }
             )
 
-        runtime_backends = [
-            getattr(agent, "backend", None)
-            for agent in [*self.specialists.values(), self.supervisor_agent]
-            if agent is not None
-        ]
-        requires_backend_probe = any(
-            hasattr(backend, "primary_name") and hasattr(backend, "fallback_name")
-            for backend in runtime_backends
-            if backend is not None
-        )
-        if not requires_backend_probe:
+        if not self._requires_backend_probe:
             checks.append(
                 {
                     "type": "backend",
@@ -417,7 +738,7 @@ class Supervisor:
 
         for check_name, command in command_specs:
             try:
-                tokens = shlex.split(command)
+                tokens = _split_command(command)
             except ValueError as exc:
                 checks.append(
                     {
@@ -466,15 +787,18 @@ class Supervisor:
         return checks
 
     def _record_preflight(self, payload: dict[str, Any]) -> None:
-        metrics = self.state.get_metrics()
-        history = metrics.get("preflight_history", [])
-        if not isinstance(history, list):
-            history = []
-        history.append(payload)
-        metrics["preflight"] = payload
-        metrics["preflight_history"] = history[-30:]
-        self.state.set_metrics(metrics)
-
+        with self._metrics_batch() as metrics:
+            history = metrics.get("preflight_history", [])
+            if not isinstance(history, list):
+                history = []
+            history.append(payload)
+            self._set_metric("preflight", payload)
+            self._set_metric("preflight_history", history[-30:])
+
+        # A passing preflight reaches the context through run()'s initial context write, so
+        # only a failing one (which aborts the run) needs its own read-modify-write here.
+        if payload.get("ok"):
+            return
         context = self.state.get_context()
         context["preflight"] = {
             "checked_at": payload.get("checked_at"),
@@ -486,6 +810,7 @@ class Supervisor:
 
     def _run_preflight(self, *, resume: bool) -> dict[str, Any]:
         checks: list[dict[str, Any]] = []
+        self._commands_available(self._preflight_executables())
         checks.extend(self._preflight_backend_checks())
         checks.extend(self._preflight_command_checks())
         if self._isolated_dirty_paths:
@@ -521,40 +846,93 @@ class Supervisor:
         return payload
 
     def _persist_tasks(self, tasks: list[WorkTask]) -> None:
-        self.state.set_tasks([asdict(task) for task in tasks])
+        self.state.set_tasks([task.to_dict() for task in tasks])
 
     def _append_phase_history(
-        self, context: dict[str, Any], phase: str, status: str
+        self, context: dict[str, Any], phase: str, status: str, *, at: str | None = None
     ) -> dict[str, Any]:
         session = context.setdefault("session", {})
         history = session.setdefault("phase_history", [])
-        history.append({"phase": phase, "status": status, "at": _utcnow_iso()})
+        history.append({"phase": phase, "status": status, "at": at or _utcnow_iso()})
         return context
 
+    def _record_phase(
+        self,
+        task_type: str,
+        outcome: str,
+        *,
+        phase: str,
+        at: str | None = None,
+        **updates: Any,
+    ) -> None:
+        # A phase transition is one context write: the history entry, the new phase and any
+        # extra field updates (which may include the run-level "status").
+        context = self._append_phase_history(
+            self.state.get_context(), task_type, outcome, at=at
+        )
+        context["phase"] = phase
+        context.update(updates)
+        self.state.set_context(context)
+
     def _update_task_status(
         self,
         tasks: list[WorkTask],
+        task_by_id: dict[str, WorkTask],
         task_id: str,
         status: str,
         *,
         reason: str | None = None,
+        persist: bool = True,
+        at: str | None = None,
     ) -> None:
-        for task in tasks:
-            if task.id == task_id:
-                task.status = status
-                if status == "in_progress":
-                    task.started_at = _utcnow_iso()
-                if status in {"completed", "failed", "skipped"}:
-                    task.completed_at = _utcnow_iso()
-                if reason:
-                    task.failure_reason = reason
-                break
-        self._persist_tasks(tasks)
+        task = task_by_id.get(task_id)
+        if task is not None:
+            task.status = status
+            if status == "in_progress":
+                task.started_at = at or _utcnow_iso()
+            if status in {"completed", "failed", "skipped"}:
+                task.completed_at = at or _utcnow_iso()
+            if reason:
+                task.failure_reason = reason
+        if persist:
+            self._persist_tasks(tasks)
+
+    @contextmanager
+    def _metrics_batch(self) -> Iterator[dict[str, Any]]:
+        # Metric helpers inside one scope share a single loaded dict and record the keys
+        # they set through _set_metric. The outermost scope writes back only those keys,
+        # merged over the latest stored metrics so patch-stack updates made in the meantime
+        # are kept.
+        if self._metrics_live is not None:
+            yield self._metrics_live
+            return
+        live = self.state.get_metrics()
+        self._metrics_live = live
+        self._metrics_dirty = set()
+        try:
+            yield live
+        finally:
+            self._metrics_live = None
+            changed = {key: live[key] for key in self._metrics_dirty}
+            self._metrics_dirty = set()
+            if changed:
+
+                def _updater(payload: Any) -> dict[str, Any]:
+                    metrics = payload if isinstance(payload, dict) else {}
+                    metrics.update(changed)
+                    return metrics
+
+                self.state.update_json("metrics", _updater, default={})
+
+    def _set_metric(self, key: str, value: Any) -> None:
+        # Joins the enclosing batch when there is one; the key is written back on its exit.
+        with self._metrics_batch() as metrics:
+            metrics[key] = value
+            self._metrics_dirty.add(key)
 
     def _increment_metric(self, key: str, value: int = 1) -> None:
-        metrics = self.state.get_metrics()
-        metrics[key] = int(metrics.get(key, 0)) + value
-        self.state.set_metrics(metrics)
+        with self._metrics_batch() as metrics:
+            self._set_metric(key, int(metrics.get(key, 0)) + value)
 
     def _upsert_run_record(self, run_id: str, updates: dict[str, Any]) -> None:
         def _updater(payload: Any) -> dict[str, Any]:
@@ -570,8 +948,7 @@ class Supervisor:
 
     def _acquire_run_lease(self, run_id: str, *, resume: bool) -> None:
         now_epoch = time.time()
-        lease_ttl = max(30.0, float(self.config.backend.timeout_seconds) * 2.0)
-        expires_epoch = now_epoch + lease_ttl
+        expires_epoch = now_epoch + self._lease_ttl
         now_iso = _utcnow_iso()
 
         def _updater(payload: Any) -> dict[str, Any]:
@@ -592,6 +969,8 @@ class Supervisor:
             return leases
 
         self.state.update_json("leases", _updater, default={})
+        self._pending_heartbeat = None
+        self._last_heartbeat_flush = now_epoch
         self._upsert_run_record(
             run_id,
             {
@@ -604,30 +983,46 @@ class Supervisor:
 
     def _heartbeat_run(self, run_id: str, *, task_id: str | None = None) -> None:
         now_epoch = time.time()
-        lease_ttl = max(30.0, float(self.config.backend.timeout_seconds) * 2.0)
-        expires_epoch = now_epoch + lease_ttl
         now_iso = _utcnow_iso()
+        pending = self._pending_heartbeat
+        if pending is None or pending["run_id"] != run_id:
+            pending = {"run_id": run_id, "task_id": None, "run_updates": {}}
+        pending["heartbeat_at"] = now_iso
+        pending["expires_epoch"] = now_epoch + self._lease_ttl
+        pending["run_updates"]["heartbeat_at"] = now_iso
+        if task_id:
+            pending["task_id"] = task_id
+            pending["run_updates"]["active_task_id"] = task_id
+        self._pending_heartbeat = pending
+
+        if now_epoch - self._last_heartbeat_flush >= self._heartbeat_flush_interval:
+            self._flush_heartbeat()
+
+    def _flush_heartbeat(self) -> None:
+        pending = self._pending_heartbeat
+        if pending is None:
+            return
+        self._pending_heartbeat = None
+        run_id = pending["run_id"]
 
         def _updater(payload: Any) -> dict[str, Any]:
             leases = payload if isinstance(payload, dict) else {}
             active = leases.get("active")
             if not isinstance(active, dict) or str(active.get("run_id", "")) != run_id:
                 active = {"run_id": run_id}
-            active["heartbeat_at"] = now_iso
-            active["expires_epoch"] = expires_epoch
-            if task_id:
-                active["task_id"] = task_id
+            active["heartbeat_at"] = pending["heartbeat_at"]
+            active["expires_epoch"] = pending["expires_epoch"]
+            if pending["task_id"]:
+                active["task_id"] = pending["task_id"]
             leases["active"] = active
             return leases
 
         self.state.update_json("leases", _updater, default={})
-        run_updates: dict[str, Any] = {"heartbeat_at": now_iso}
-        if task_id:
-            run_updates["active_task_id"] = task_id
-        self._upsert_run_record(run_id, run_updates)
+        self._upsert_run_record(run_id, pending["run_updates"])
+        self._last_heartbeat_flush = time.time()
 
-    def _release_run_lease(self, run_id: str, *, status: str) -> None:
-        now_iso = _utcnow_iso()
+    def _release_run_lease(self, run_id: str, *, status: str, at: str | None = None) -> None:
+        now_iso = at or _utcnow_iso()
 
         def _updater(payload: Any) -> dict[str, Any]:
             leases = payload if isinstance(payload, dict) else {}
@@ -637,17 +1032,21 @@ class Supervisor:
             return leases
 
         self.state.update_json("leases", _updater, default={})
-        self._upsert_run_record(
-            run_id,
-            {
-                "status": status,
-                "ended_at": now_iso,
-            },
-        )
+        # Unflushed heartbeat fields ride along with the final run record update.
+        pending = self._pending_heartbeat
+        self._pending_heartbeat = None
+        run_updates: dict[str, Any] = {}
+        if pending is not None and pending["run_id"] == run_id:
+            run_updates.update(pending["run_updates"])
+        run_updates.update({"status": status, "ended_at": now_iso})
+        self._upsert_run_record(run_id, run_updates)
+
+    def _decision_serial(self) -> str:
+        return format(next(self._decision_serials) & 0xFFFFFFFF, "08x")
 
     def _record_decision(self, task: WorkTask, response: SpecialistResponse) -> None:
         decision = {
-            "id": f"dec-{task.id}-{uuid4().hex[:8]}",
+            "id": f"dec-{task.id}-{self._decision_serial()}",
             "topic": task.type,
             "decided_by": task.assigned_to,
             "approved_by": "supervisor",
@@ -666,27 +1065,26 @@ class Supervisor:
         self.state.add_decision(decision)
 
     def _record_gate_result(self, gate: dict[str, Any]) -> None:
-        metrics = self.state.get_metrics()
-        quality_gates = metrics.get("quality_gates", [])
-        if not isinstance(quality_gates, list):
-            quality_gates = []
-        quality_gates.append(gate)
-        metrics["quality_gates"] = quality_gates[-200:]
-        if not gate.get("passed"):
-            failures = metrics.get("gate_failures", [])
-            if not isinstance(failures, list):
-                failures = []
-            failures.append(
-                {
-                    "name": gate.get("name"),
-                    "task_id": gate.get("task_id"),
-                    "reason": gate.get("reason", "gate failed"),
-                    "checked_at": gate.get("checked_at"),
-                }
-            )
-            metrics["gate_failures"] = failures[-50:]
-            metrics["last_gate_failure"] = failures[-1]
-        self.state.set_metrics(metrics)
+        with self._metrics_batch() as metrics:
+            quality_gates = metrics.get("quality_gates", [])
+            if not isinstance(quality_gates, list):
+                quality_gates = []
+            quality_gates.append(gate)
+            self._set_metric("quality_gates", quality_gates[-200:])
+            if not gate.get("passed"):
+                failures = metrics.get("gate_failures", [])
+                if not isinstance(failures, list):
+                    failures = []
+                failures.append(
+                    {
+                        "name": gate.get("name"),
+                        "task_id": gate.get("task_id"),
+                        "reason": gate.get("reason", "gate failed"),
+                        "checked_at": gate.get("checked_at"),
+                    }
+                )
+                self._set_metric("gate_failures", failures[-50:])
+                self._set_metric("last_gate_failure", failures[-1])
 
     def _run_command(self, command: str) -> dict[str, Any]:
         command_text = command.strip()
@@ -700,11 +1098,13 @@ class Supervisor:
                 "used_shell": False,
             }
 
-        used_shell = bool(SHELL_REQUIRED_PATTERN.search(command_text))
+        used_shell = not _SHELL_META.isdisjoint(command_text) and bool(
+            SHELL_REQUIRED_PATTERN.search(command_text)
+        )
         command_payload: str | list[str] = command_text
         if not used_shell:
             try:
-                command_payload = shlex.split(command_text)
+                command_payload = list(_split_command(command_text))
             except ValueError:
                 used_shell = True
                 command_payload = command_text
@@ -725,19 +1125,20 @@ class Supervisor:
             "used_shell": used_shell,
         }
 
-    def _assert_guardrail_test_coverage(self, run_patch_files: list[str]) -> tuple[bool, str]:
+    def _assert_guardrail_test_coverage(
+        self, run_patch_files: Collection[str]
+    ) -> tuple[bool, str]:
         guarded_patterns = self.config.guardrails.require_tests_for
-        guarded_changes = []
+        # One pass: any touched test satisfies the guardrail, so stop at the first one.
+        seen_guarded = False
         for file_path in run_patch_files:
-            normalized = file_path.replace("\\", "/")
-            for pattern in guarded_patterns:
-                if fnmatch.fnmatch(normalized, pattern):
-                    guarded_changes.append(normalized)
-                    break
-        if not guarded_changes:
-            return True, ""
-        test_touched = any(self._is_test_path(path) for path in run_patch_files)
-        if test_touched:
+            if self._is_test_path(file_path):
+                return True, ""
+            if not seen_guarded and self._matches_any_pattern(
+                file_path, self._guardrail_test_res
+            ):
+                seen_guarded = True
+        if not seen_guarded:
             return True, ""
         return False, (
             "Guardrail require_tests_for failed: source files changed without matching tests. "
@@ -745,22 +1146,47 @@ class Supervisor:
         )
 
     def _is_guarded_source_path(self, path: str) -> bool:
-        normalized = path.replace("\\", "/")
-        patterns = list(self.config.guardrails.require_tests_for)
-        if patterns:
-            return any(fnmatch.fnmatch(normalized, pattern) for pattern in patterns)
+        if self._guardrail_test_res:
+            return self._matches_any_pattern(path, self._guardrail_test_res)
         return (
             not self._is_internal_runtime_path(path)
             and not self._is_test_path(path)
             and not self._is_documentation_evidence_path(path)
         )
 
+    def _classify_review_paths(
+        self, paths: Collection[str]
+    ) -> tuple[list[str], list[str], list[str]]:
+        # One pass per path; the documentation verdict also feeds the source fallback below.
+        source_files: list[str] = []
+        doc_files: list[str] = []
+        changelog_files: list[str] = []
+        for path in paths:
+            is_doc = self._is_documentation_evidence_path(path)
+            if self._guardrail_test_res:
+                is_source = self._matches_any_pattern(path, self._guardrail_test_res)
+            else:
+                is_source = (
+                    not is_doc
+                    and not self._is_internal_runtime_path(path)
+                    and not self._is_test_path(path)
+                )
+            if is_source:
+                source_files.append(path)
+            if is_doc:
+                doc_files.append(path)
+            if self._is_changelog_evidence_path(path):
+                changelog_files.append(path)
+        return source_files, doc_files, changelog_files
+
+    # Guardrail and review gates classify the same patch paths repeatedly; the pure
+    # classifiers are memoized instead of recomputing the string splits each time.
     @staticmethod
+    @lru_cache(maxsize=4096)
     def _is_test_path(path: str) -> bool:
-        normalized = path.replace("\\", "/").lower()
+        normalized = _normalized_review_path(path)
         name = normalized.rsplit("/", maxsplit=1)[-1]
-        segments = set(normalized.split("/"))
-        if {"tests", "test", "__tests__", "spec", "specs"} & segments:
+        if not _TEST_SEGMENTS.isdisjoint(normalized.split("/")):
             return True
         if name.startswith("test_") or name.endswith("_test.py"):
             return True
@@ -779,8 +1205,9 @@ class Supervisor:
         )
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def _is_documentation_path(path: str) -> bool:
-        normalized = path.replace("\\", "/").lower()
+        normalized = _normalized_review_path(path)
         name = normalized.rsplit("/", maxsplit=1)[-1]
         if name.startswith("readme") or "changelog" in name:
             return True
@@ -788,45 +1215,37 @@ class Supervisor:
             return True
         return name.endswith((".md", ".rst", ".adoc"))
 
-    def _matches_any_pattern(self, path: str, patterns: list[str]) -> bool:
-        normalized = path.replace("\\", "/")
-        for pattern in patterns:
-            if fnmatch.fnmatch(normalized, pattern):
-                return True
-        return False
+    @staticmethod
+    def _matches_any_pattern(path: str, patterns: GlobSet) -> bool:
+        return patterns.match(path) is not None
 
     def _is_documentation_evidence_path(self, path: str) -> bool:
-        if self._matches_any_pattern(path, list(self.config.workflow.review_docs_patterns)):
+        if self._matches_any_pattern(path, self._review_docs_res):
             return True
         return self._is_documentation_path(path)
 
     def _is_changelog_evidence_path(self, path: str) -> bool:
-        if self._matches_any_pattern(path, list(self.config.workflow.review_changelog_patterns)):
+        if self._matches_any_pattern(path, self._review_changelog_res):
             return True
-        return "changelog" in path.lower()
+        return "changelog" in _normalized_review_path(path)
 
     @staticmethod
     def _is_internal_runtime_path(path: str) -> bool:
-        normalized = path.replace("\\", "/").lower()
-        return normalized.startswith(".architect/")
+        return _normalized_review_path(path).startswith(".architect/")
 
     def _plan_quality_signals(self, content: str) -> dict[str, Any]:
         lower = content.lower()
-        steps = self._extract_plan_steps(content)
-        return {
-            "steps": len(steps),
-            "has_interface": any(token in lower for token in ("interface", "boundary", "api")),
-            "has_risks": any(token in lower for token in ("risk", "mitigation", "tradeoff")),
-            "has_analysis": any(token in lower for token in ("analysis", "problem", "context")),
-            "has_milestones": any(token in lower for token in ("milestone", "phase", "step")),
-        }
+        signals: dict[str, Any] = {"steps": self._count_plan_steps(content)}
+        for group, tokens in _PLAN_SIGNAL_TOKENS.items():
+            signals[group] = any(token in lower for token in tokens)
+        return signals
 
     def _evaluate_gate(
         self,
         task: WorkTask,
         response: SpecialistResponse,
         *,
-        run_patch_files: list[str],
+        run_patch_files: Collection[str],
         current_patch: Patch | None,
     ) -> dict[str, Any]:
         gate_name = self._gate_name(task.type)
@@ -860,18 +1279,40 @@ class Supervisor:
             if not content:
                 passed = False
                 reason = "Implementation output is empty."
-            if passed and self.config.workflow.auto_lint:
-                lint_result = self._run_command(self.config.project.lint_command)
-                artifacts.append(lint_result)
+            if (
+                passed
+                and self.config.workflow.parallel_quality_commands
+                and self.config.workflow.auto_lint
+                and self.config.project.type_check_command
+            ):
+                # Both commands only read the worktree, so they can share the wall-clock time;
+                # artifacts and the failure reason keep the serial order (lint first).
+                with ThreadPoolExecutor(max_workers=2) as pool:
+                    lint_run = pool.submit(self._run_command, self.config.project.lint_command)
+                    type_run = pool.submit(
+                        self._run_command, self.config.project.type_check_command
+                    )
+                    lint_result, type_result = lint_run.result(), type_run.result()
+                artifacts.extend((lint_result, type_result))
                 if lint_result["exit_code"] != 0:
                     passed = False
                     reason = "Lint command failed."
-            if passed and self.config.project.type_check_command:
-                type_result = self._run_command(self.config.project.type_check_command)
-                artifacts.append(type_result)
-                if type_result["exit_code"] != 0:
+                elif type_result["exit_code"] != 0:
                     passed = False
                     reason = "Type-check command failed."
+            elif passed:
+                if self.config.workflow.auto_lint:
+                    lint_result = self._run_command(self.config.project.lint_command)
+                    artifacts.append(lint_result)
+                    if lint_result["exit_code"] != 0:
+                        passed = False
+                        reason = "Lint command failed."
+                if passed and self.config.project.type_check_command:
+                    type_result = self._run_command(self.config.project.type_check_command)
+                    artifacts.append(type_result)
+                    if type_result["exit_code"] != 0:
+                        passed = False
+                        reason = "Type-check command failed."
             if passed and current_patch is not None:
                 max_files = self.config.guardrails.max_file_changes_per_patch
                 file_count = len(current_patch.files_changed)
@@ -891,10 +1332,7 @@ class Supervisor:
                     )
             if passed and current_patch is not None:
                 for file_path in current_patch.files_changed:
-                    matched = self._matches_forbidden_path(
-                        file_path,
-                        self.config.guardrails.forbidden_paths,
-                    )
+                    matched = self._matches_forbidden_path(file_path, self._forbidden_path_res)
                     if matched:
                         passed = False
                         reason = (
@@ -961,13 +1399,9 @@ class Supervisor:
                 if not coverage_ok:
                     passed = False
                     reason = coverage_reason
-            source_files = [
-                p
-                for p in run_patch_files
-                if self._is_guarded_source_path(p)
-            ]
-            doc_files = [p for p in run_patch_files if self._is_documentation_evidence_path(p)]
-            changelog_files = [p for p in run_patch_files if self._is_changelog_evidence_path(p)]
+            source_files, doc_files, changelog_files = self._classify_review_paths(
+                run_patch_files
+            )
             artifacts.append(
                 {
                     "type": "review_file_evidence",
@@ -1022,39 +1456,12 @@ class Supervisor:
             "checked_at": _utcnow_iso(),
         }
 
-    def _next_ready_task(self, tasks: list[WorkTask]) -> WorkTask | None:
-        ready = self._ready_tasks(tasks)
-        if not ready:
-            return None
-        return ready[0]
-
-    def _ready_tasks(self, tasks: list[WorkTask]) -> list[WorkTask]:
-        task_by_id = {task.id: task for task in tasks}
-        ready: list[WorkTask] = []
-        for task in tasks:
-            if task.status != "pending":
-                continue
-            if all(
-                task_by_id.get(dep_id) and task_by_id[dep_id].status == "completed"
-                for dep_id in task.depends_on
-            ):
-                ready.append(task)
-        return ready
-
     def _allowed_tools_for_task(self, task: WorkTask) -> list[str] | None:
         if task.allowed_tools:
             return self._normalize_tools(task.allowed_tools)
-        if task.type == "implement":
-            return self._normalize_tools(
-                ["read_file", "write_file", "edit_file", "run_command", "search"]
-            )
-        if task.type == "test":
-            return self._normalize_tools(["read_file", "run_command"])
-        if task.type == "review":
-            return self._normalize_tools(["read_file", "run_command", "search"])
-        if task.type == "document":
-            return self._normalize_tools(["read_file", "write_file", "edit_file", "search"])
-        return None
+        defaults = _DEFAULT_TASK_TOOLS.get(task.type)
+        # Callers get their own list so the shared policy tuple cannot be mutated.
+        return list(defaults) if defaults is not None else None
 
     async def _run_specialist(
         self,
@@ -1067,7 +1474,7 @@ class Supervisor:
         if specialist is None:
             raise RuntimeError(f"No specialist registered for role '{task.assigned_to}'.")
         allowed_tools = self._allowed_tools_for_task(task)
-        context = {"goal": goal, "task": asdict(task)}
+        context = {"goal": goal, "task": task.to_dict()}
         if working_directory is not None:
             context["_working_directory"] = str(working_directory)
         return await specialist.run(
@@ -1090,7 +1497,7 @@ class Supervisor:
         steps = self._extract_plan_steps(response.content)
         self.state.add_decision(
             {
-                "id": f"dec-supervisor-{uuid4().hex[:8]}",
+                "id": f"dec-supervisor-{self._decision_serial()}",
                 "topic": "goal_decomposition",
                 "decided_by": "supervisor",
                 "approved_by": "supervisor",
@@ -1110,11 +1517,11 @@ class Supervisor:
                 "Re-plan after a failed quality gate. "
                 f"Task={failed_task.id}. Reason={reason}. Provide concise corrective steps."
             ),
-            context={"goal": goal, "failed_task": asdict(failed_task), "reason": reason},
+            context={"goal": goal, "failed_task": failed_task.to_dict(), "reason": reason},
         )
         self.state.add_decision(
             {
-                "id": f"dec-replan-{failed_task.id}-{uuid4().hex[:8]}",
+                "id": f"dec-replan-{failed_task.id}-{self._decision_serial()}",
                 "topic": "replan",
                 "decided_by": "planner",
                 "approved_by": "supervisor",
@@ -1129,27 +1536,22 @@ class Supervisor:
         run_dir.mkdir(parents=True, exist_ok=True)
         return run_dir / f"{task.id}.md"
 
+    @staticmethod
     def _write_task_artifact(
-        self, run_id: str, task: WorkTask, response: SpecialistResponse
-    ) -> Path:
-        artifact_path = self._task_artifact_path(run_id, task)
-        artifact_path.write_text(
-            "\n".join(
-                [
-                    f"# Task {task.id}",
-                    "",
-                    f"Type: {task.type}",
-                    f"Assigned: {task.assigned_to}",
-                    f"Generated At: {_utcnow_iso()}",
-                    "",
-                    "## Output",
-                    response.content.strip(),
-                    "",
-                ]
-            ),
-            encoding="utf-8",
-        )
-        return artifact_path
+        artifact_path: Path, task: WorkTask, response: SpecialistResponse
+    ) -> None:
+        # Header and body are written separately so long outputs are not copied into a
+        # joined string first.
+        with artifact_path.open("w", encoding="utf-8") as handle:
+            handle.write(
+                f"# Task {task.id}\n\n"
+                f"Type: {task.type}\n"
+                f"Assigned: {task.assigned_to}\n"
+                f"Generated At: {_utcnow_iso()}\n\n"
+                "## Output\n"
+            )
+            handle.write(response.content.strip())
+            handle.write("\n")
 
     def _tracked_fallback_patch_path(self, run_id: str, task: WorkTask) -> Path:
         if self.config.workflow.fallback_artifact_mode == "tracked":
@@ -1174,17 +1576,7 @@ class Supervisor:
         )
 
     def _append_session_patch(self, patch: Patch) -> None:
-        session_context = self.state.get_context()
-        session = session_context.get("session", {})
-        if not isinstance(session, dict):
-            return
-        patch_stack = session.get("patch_stack", [])
-        if not isinstance(patch_stack, list):
-            patch_stack = []
-        patch_stack.append(patch.to_dict())
-        session["patch_stack"] = patch_stack
-        session_context["session"] = session
-        self.state.set_context(session_context)
+        self.state.append_session_patch(patch.to_dict())
 
     async def _run_conflict_resolution(
         self,
@@ -1199,108 +1591,155 @@ class Supervisor:
         if coder is None:
             return None
 
+        # Agents copy their context, so one task payload serves every step below.
+        review_payload = review_task.to_dict()
+        # Each excerpt is sliced once and shared by the decisions and contexts below.
         critic_clarification = critic_output
-        if critic is not None:
-            critic_response = await critic.run(
+        critic_excerpt = critic_output[:4000]
+        planner_recommendation = ""
+        planner_excerpt = ""
+
+        # Decisions are buffered and written in one state update, including when a specialist
+        # call fails part-way through.
+        decisions: list[dict[str, Any]] = []
+
+        def _ask_critic(agent: SpecialistAgent) -> Awaitable[SpecialistResponse]:
+            return agent.run(
                 instruction=(
                     "Clarify blocker findings with concise remediation guidance.\n\n"
-                    f"Review output:\n{critic_output[:4000]}"
+                    f"Review output:\n{critic_excerpt}"
                 ),
-                context={"goal": goal, "review_task": asdict(review_task), "phase": "conflict"},
-            )
-            critic_clarification = critic_response.content.strip() or critic_output
-            self.state.add_decision(
-                {
-                    "id": f"dec-conflict-critic-{review_task.id}-{uuid4().hex[:8]}",
-                    "topic": "conflict_resolution",
-                    "decided_by": "critic",
-                    "approved_by": "supervisor",
-                    "decision": critic_clarification[:4000],
-                    "rationale": "Critic clarification for remediation planning.",
-                    "created_at": _utcnow_iso(),
-                }
+                context={"goal": goal, "review_task": review_payload, "phase": "conflict"},
             )
 
-        planner_recommendation = ""
-        if planner is not None:
-            planner_response = await planner.run(
+        def _ask_planner(
+            agent: SpecialistAgent, clarification: str
+        ) -> Awaitable[SpecialistResponse]:
+            return agent.run(
                 instruction=(
                     "Given critic blockers, propose remediation alternatives with tradeoffs. "
                     "Return a concise selected recommendation."
                 ),
                 context={
                     "goal": goal,
-                    "review_task": asdict(review_task),
-                    "critic_clarification": critic_clarification[:4000],
+                    "review_task": review_payload,
+                    "critic_clarification": clarification,
                 },
             )
-            planner_recommendation = planner_response.content.strip()
-            self.state.add_decision(
-                {
-                    "id": f"dec-conflict-planner-{review_task.id}-{uuid4().hex[:8]}",
-                    "topic": "conflict_resolution",
-                    "decided_by": "planner",
-                    "approved_by": "supervisor",
-                    "decision": planner_recommendation[:4000],
-                    "rationale": "Planner alternatives for blocker remediation.",
-                    "created_at": _utcnow_iso(),
-                }
-            )
 
-        supervisor_decision = planner_recommendation or critic_clarification
-        if self.supervisor_agent is not None:
-            supervisor_response = await self.supervisor_agent.run(
+        def _critic_decision() -> dict[str, Any]:
+            return {
+                "id": f"dec-conflict-critic-{review_task.id}-{self._decision_serial()}",
+                "topic": "conflict_resolution",
+                "decided_by": "critic",
+                "approved_by": "supervisor",
+                "decision": critic_excerpt,
+                "rationale": "Critic clarification for remediation planning.",
+                "created_at": _utcnow_iso(),
+            }
+
+        def _planner_decision() -> dict[str, Any]:
+            return {
+                "id": f"dec-conflict-planner-{review_task.id}-{self._decision_serial()}",
+                "topic": "conflict_resolution",
+                "decided_by": "planner",
+                "approved_by": "supervisor",
+                "decision": planner_excerpt,
+                "rationale": "Planner alternatives for blocker remediation.",
+                "created_at": _utcnow_iso(),
+            }
+
+        try:
+            if (
+                self.config.workflow.parallel_conflict_inputs
+                and critic is not None
+                and planner is not None
+            ):
+                # The planner works from the raw review output instead of waiting for the critic's
+                # clarification.
+                critic_response, planner_response = await asyncio.gather(
+                    _ask_critic(critic), _ask_planner(planner, critic_excerpt)
+                )
+                critic_clarification = critic_response.content.strip() or critic_output
+                critic_excerpt = critic_clarification[:4000]
+                planner_recommendation = planner_response.content.strip()
+                planner_excerpt = planner_recommendation[:4000]
+                decisions.extend((_critic_decision(), _planner_decision()))
+            else:
+                if critic is not None:
+                    critic_response = await _ask_critic(critic)
+                    critic_clarification = critic_response.content.strip() or critic_output
+                    critic_excerpt = critic_clarification[:4000]
+                    decisions.append(_critic_decision())
+                if planner is not None:
+                    planner_response = await _ask_planner(planner, critic_excerpt)
+                    planner_recommendation = planner_response.content.strip()
+                    planner_excerpt = planner_recommendation[:4000]
+                    decisions.append(_planner_decision())
+
+            supervisor_decision = planner_recommendation or critic_clarification
+            supervisor_excerpt = supervisor_decision[:4000]
+            if self.supervisor_agent is not None:
+                supervisor_response = await self.supervisor_agent.run(
+                    instruction=(
+                        "Adjudicate conflict-resolution inputs and pick one remediation strategy. "
+                        "Respond with a concise decision and rationale."
+                    ),
+                    context={
+                        "goal": goal,
+                        "review_task": review_payload,
+                        "critic_clarification": critic_excerpt,
+                        "planner_recommendation": planner_excerpt,
+                    },
+                )
+                supervisor_decision = supervisor_response.content.strip() or supervisor_decision
+                supervisor_excerpt = supervisor_decision[:4000]
+                decisions.append(
+                    {
+                        "id": f"dec-conflict-supervisor-{review_task.id}-{self._decision_serial()}",
+                        "topic": "conflict_resolution",
+                        "decided_by": "supervisor",
+                        "approved_by": "supervisor",
+                        "decision": supervisor_excerpt,
+                        "rationale": "Supervisor adjudication over specialist conflict inputs.",
+                        "created_at": _utcnow_iso(),
+                    }
+                )
+
+            response = await coder.run(
                 instruction=(
-                    "Adjudicate conflict-resolution inputs and pick one remediation strategy. "
-                    "Respond with a concise decision and rationale."
+                    "Apply remediation selected by supervisor to resolve review blockers. "
+                    "Return concise actions and confirmed fixes.\n\n"
+                    f"Supervisor decision:\n{supervisor_decision[:3000]}\n\n"
+                    f"Critic clarification:\n{critic_clarification[:3000]}"
                 ),
                 context={
                     "goal": goal,
-                    "review_task": asdict(review_task),
-                    "critic_clarification": critic_clarification[:4000],
-                    "planner_recommendation": planner_recommendation[:4000],
+                    "review_task": review_payload,
+                    "remediation": True,
+                    "planner_recommendation": planner_excerpt,
+                    "supervisor_decision": supervisor_excerpt,
                 },
+                allowed_tools=["read_file", "write_file", "edit_file", "run_command", "search"],
             )
-            supervisor_decision = supervisor_response.content.strip() or supervisor_decision
-            self.state.add_decision(
+            decisions.append(
                 {
-                    "id": f"dec-conflict-supervisor-{review_task.id}-{uuid4().hex[:8]}",
+                    "id": f"dec-conflict-{review_task.id}-{self._decision_serial()}",
                     "topic": "conflict_resolution",
-                    "decided_by": "supervisor",
+                    "decided_by": "coder",
                     "approved_by": "supervisor",
-                    "decision": supervisor_decision[:4000],
-                    "rationale": "Supervisor adjudication over specialist conflict inputs.",
+                    "decision": response.content[:4000],
+                    "rationale": "Automated remediation loop after BLOCKER review findings.",
                     "created_at": _utcnow_iso(),
                 }
             )
-
-        response = await coder.run(
-            instruction=(
-                "Apply remediation selected by supervisor to resolve review blockers. "
-                "Return concise actions and confirmed fixes.\n\n"
-                f"Supervisor decision:\n{supervisor_decision[:3000]}\n\n"
-                f"Critic clarification:\n{critic_clarification[:3000]}"
-            ),
-            context={
-                "goal": goal,
-                "review_task": asdict(review_task),
-                "remediation": True,
-                "planner_recommendation": planner_recommendation[:4000],
-                "supervisor_decision": supervisor_decision[:4000],
-            },
-            allowed_tools=["read_file", "write_file", "edit_file", "run_command", "search"],
-        )
-        self.state.add_decision(
-            {
-                "id": f"dec-conflict-{review_task.id}-{uuid4().hex[:8]}",
-                "topic": "conflict_resolution",
-                "decided_by": "coder",
-                "approved_by": "supervisor",
-                "decision": response.content[:4000],
-                "rationale": "Automated remediation loop after BLOCKER review findings.",
-                "created_at": _utcnow_iso(),
-            }
-        )
+        except BaseException:
+            # Decisions made before the failure are still recorded, but a failing write must
+            # not replace the specialist error that is already propagating.
+            with suppress(Exception):
+                self.state.add_decisions(decisions)
+            raise
+        self.state.add_decisions(decisions)
         if not self.patches.git_enabled:
             return None
         patch = self.patches.create_task_patch_from_worktree(
@@ -1316,32 +1755,39 @@ class Supervisor:
             ),
             fallback_mode=self.config.workflow.fallback_artifact_mode,
             max_files=self.config.guardrails.max_file_changes_per_patch,
-            forbidden_paths=list(self.config.guardrails.forbidden_paths),
-            exclude_paths=list(self._isolated_dirty_paths),
+            forbidden_paths=self._forbidden_paths,
+            exclude_paths=self._isolated_dirty_paths,
         )
         return patch
 
     @staticmethod
     def _task_from_dict(payload: dict[str, Any]) -> WorkTask | None:
+        # Reject entries missing a required key up front instead of raising KeyError.
+        required = [payload.get(key, _MISSING) for key in _REQUIRED_TASK_KEYS]
+        if any(value is _MISSING for value in required):
+            return None
+        task_id, task_type, assigned_to, description = required
         try:
-            return WorkTask(
-                id=str(payload["id"]),
-                type=str(payload["type"]),
-                assigned_to=str(payload["assigned_to"]),
-                description=str(payload["description"]),
-                status=str(payload.get("status", "pending")),
-                depends_on=list(payload.get("depends_on", [])),
-                created_at=str(payload.get("created_at") or _utcnow_iso()),
-                started_at=payload.get("started_at"),
-                completed_at=payload.get("completed_at"),
-                output_summary=str(payload.get("output_summary", "")),
-                attempt=int(payload.get("attempt", 0)),
-                failure_reason=payload.get("failure_reason"),
-                patch_id=payload.get("patch_id"),
-                allowed_tools=payload.get("allowed_tools"),
-            )
-        except (KeyError, TypeError, ValueError):
+            attempt = int(payload.get("attempt", 0))
+            depends_on = list(payload.get("depends_on", []))
+        except (TypeError, ValueError):
             return None
+        return WorkTask(
+            id=str(task_id),
+            type=str(task_type),
+            assigned_to=str(assigned_to),
+            description=str(description),
+            status=str(payload.get("status", "pending")),
+            depends_on=depends_on,
+            created_at=str(payload.get("created_at") or _utcnow_iso()),
+            started_at=payload.get("started_at"),
+            completed_at=payload.get("completed_at"),
+            output_summary=str(payload.get("output_summary", "")),
+            attempt=attempt,
+            failure_reason=payload.get("failure_reason"),
+            patch_id=payload.get("patch_id"),
+            allowed_tools=payload.get("allowed_tools"),
+        )
 
     def _load_pending_modify_tasks(self) -> list[WorkTask]:
         tasks = self.state.get_tasks()
@@ -1350,14 +1796,12 @@ class Supervisor:
         for item in tasks:
             if not isinstance(item, dict):
                 continue
-            task_id = str(item.get("id", ""))
-            if not (
-                task_id.startswith("task-modify-")
-                or task_id.startswith("task-retry-")
-            ):
+            # Status first: most historical tasks are completed and drop out here.
+            status = item.get("status", "pending")
+            if not isinstance(status, str) or status not in _RELOADABLE_TASK_STATUSES:
                 continue
-            status = str(item.get("status", "pending"))
-            if status not in {"pending", "in_progress", "failed"}:
+            task_id = item.get("id")
+            if not isinstance(task_id, str) or not task_id.startswith(_MODIFY_TASK_PREFIXES):
                 continue
             if task_id in seen_ids:
                 continue
@@ -1409,14 +1853,13 @@ class Supervisor:
 
         max_chunk = max(1, int(self.config.workflow.max_patches_before_review))
         previous_gate_id = "task-plan-001"
-        for chunk_start in range(0, len(implementation_tasks), max_chunk):
-            chunk_index = (chunk_start // max_chunk) + 1
+        chunk_starts = range(0, len(implementation_tasks), max_chunk)
+        for chunk_index, chunk_start in enumerate(chunk_starts, start=1):
             chunk = implementation_tasks[chunk_start : chunk_start + max_chunk]
-            implement_ids: list[str] = []
             for task in chunk:
                 task.depends_on = [previous_gate_id]
-                tasks.append(task)
-                implement_ids.append(task.id)
+            tasks.extend(chunk)
+            implement_ids = [task.id for task in chunk]
 
             test_task_id = f"task-test-{chunk_index:03d}"
             tasks.append(
@@ -1460,14 +1903,27 @@ class Supervisor:
         if context.get("paused") and not resume:
             raise RuntimeError("Workflow is paused. Run `arch resume` first.")
 
-        dirty_paths: list[str] = []
         if not resume:
-            dirty_paths = self._ensure_clean_worktree()
-            self._record_dirty_isolation(dirty_paths)
-        else:
-            self._isolated_dirty_paths = []
+            self._command_cache.clear()
+        self._plan_critic_cache.clear()
+        dirty_paths: list[str] = []
+        # The login-shell executable probe and the branch lookup overlap with the git status
+        # scan; preflight then reads its answers from the command cache. Preflight depends on
+        # the dirty-isolation result, so it stays after the scan. Dirty-isolation and
+        # preflight records land in one metrics write.
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            probe = pool.submit(self._commands_available, self._preflight_executables())
+            branch_lookup = pool.submit(self.patches.current_branch)
+            with self._metrics_batch():
+                if not resume:
+                    dirty_paths = self._ensure_clean_worktree()
+                    self._record_dirty_isolation(dirty_paths)
+                else:
+                    self._isolated_dirty_paths = []
 
-        preflight = self._run_preflight(resume=resume)
+                probe.result()
+                preflight = self._run_preflight(resume=resume)
+        current_branch = branch_lookup.result()
 
         pending_modify_tasks = self._load_pending_modify_tasks()
         existing_tasks_payload = self.state.get_tasks()
@@ -1489,15 +1945,15 @@ class Supervisor:
             started_at = str(context.get("started_at") or now)
             session = context.get("session", {})
             if isinstance(session, dict):
-                base_branch = str(session.get("base_branch") or self.patches.current_branch())
+                base_branch = str(session.get("base_branch") or current_branch)
             else:
-                base_branch = str(context.get("active_branch") or self.patches.current_branch())
-            run_branch = self.patches.current_branch()
+                base_branch = str(context.get("active_branch") or current_branch)
+            run_branch = current_branch
             tasks = existing_tasks
         else:
             started_at = now
             run_id = f"run-{datetime.now(UTC).strftime('%Y%m%d%H%M%S')}-{uuid4().hex[:8]}"
-            base_branch = self.patches.current_branch()
+            base_branch = current_branch
             run_branch = base_branch
             if (
                 self.patches.git_enabled
@@ -1512,6 +1968,9 @@ class Supervisor:
                 description=f"Design a technical approach for: {goal}",
             )
             tasks = [plan_task]
+        # Status updates look tasks up by id; the index is rebuilt wherever `tasks` is
+        # reassigned (here and after the plan expands into the task graph).
+        task_by_id = _index_tasks(tasks)
 
         self._acquire_run_lease(run_id, resume=resume)
         self._upsert_run_record(
@@ -1561,297 +2020,367 @@ class Supervisor:
         self._heartbeat_run(run_id)
 
         supervisor_steps = await self._run_supervisor_decomposition(goal)
-        run_patch_files: list[str] = []
+        # Insertion-ordered and de-duplicated: files touched by several patches are classified
+        # once per gate, and gate artifacts keep first-touch order.
+        run_patch_files: dict[str, None] = {}
         completed_tasks = 0
         conflict_cycles = 0
         max_conflict_cycles = max(0, int(self.config.workflow.max_conflict_cycles))
         max_attempts = max(1, int(self.config.workflow.task_max_attempts))
         retry_backoff = max(0.0, float(self.config.workflow.task_retry_backoff_seconds))
+        retry_backoff_max = max(0.0, float(self.config.workflow.task_retry_backoff_max_seconds))
         max_parallel = max(1, int(self.config.workflow.max_parallel_tasks))
+        # Per-task settings are read once per run; the dirty-path snapshot is fixed by preflight.
+        fallback_mode = self.config.workflow.fallback_artifact_mode
+        max_files_per_patch = self.config.guardrails.max_file_changes_per_patch
+        forbidden_paths = self._forbidden_paths
+        plan_requires_critic = self.config.workflow.plan_requires_critic
+        isolated_dirty_paths = tuple(self._isolated_dirty_paths)
+
+        async def _execute_task(ready_task: WorkTask) -> None:
+            # Runs one task through its attempts, gate and bookkeeping. Tasks of a batch run
+            # concurrently; everything between awaits is synchronous, so shared run state
+            # (task list, patch files, counters, context) is never written mid-update.
+            nonlocal tasks, task_by_id, ready_queue, conflict_cycles, completed_tasks
+            self._heartbeat_run(run_id, task_id=ready_task.id)
+            self._record_phase(ready_task.type, "started", phase=ready_task.type)
+
+            gate: dict[str, Any] | None = None
+            response: SpecialistResponse | None = None
+            created_patch: Patch | None = None
+
+            for attempt in range(1, max_attempts + 1):
+                ready_task.attempt = attempt
+                if attempt > 1 and retry_backoff > 0:
+                    # Equal jitter keeps parallel retries from hitting the backend in lockstep.
+                    base_delay = min(retry_backoff * (2 ** (attempt - 2)), retry_backoff_max)
+                    delay = random.uniform(base_delay / 2, base_delay)
+                    await asyncio.sleep(delay)
+                    self._increment_metric("task_retry_count")
+
+                response = await self._run_specialist(ready_task, goal)
+                # One slice serves the summary, the patch body and the plan-critic prompt.
+                summary = response.content[:4000]
+                ready_task.output_summary = summary
+                artifact_path = self._task_artifact_path(run_id, ready_task)
+                # The write runs off the event loop so sibling tasks keep going, but it is
+                # awaited here: the local-mode patch records this path and the fallback patch
+                # file may overwrite it, so it has to be on disk before either happens.
+                await asyncio.to_thread(
+                    self._write_task_artifact, artifact_path, ready_task, response
+                )
 
-        try:
-            while True:
-                ready_tasks = self._ready_tasks(tasks)
-                if not ready_tasks:
-                    break
-
-                batch: list[WorkTask]
-                if max_parallel <= 1:
-                    batch = [ready_tasks[0]]
-                else:
-                    first_type = ready_tasks[0].type
-                    same_type_ready = [task for task in ready_tasks if task.type == first_type]
-                    # Git worktree mutation remains serial for now; non-mutating tasks can batch.
-                    if self.patches.git_enabled and first_type in {"implement", "document"}:
-                        batch = [same_type_ready[0]]
+                if ready_task.type == "plan" and len(tasks) == 1:
+                    plan_steps = self._extract_plan_steps(response.content)
+                    if not plan_steps:
+                        plan_steps = supervisor_steps
+                    tasks = self._create_task_graph(goal, plan_steps, pending_modify_tasks)
+                    task_by_id = _index_tasks(tasks)
+                    tasks[0].attempt = ready_task.attempt
+                    tasks[0].output_summary = ready_task.output_summary
+                    self._persist_tasks(tasks)
+                    ready_task = tasks[0]
+                    ready_queue = _ReadyQueue(tasks)
+
+                if ready_task.type in _PATCH_TASK_TYPES:
+                    patch_subject = f"architect: {ready_task.id}"
+                    if self.patches.git_enabled:
+                        created_patch = self.patches.create_task_patch_from_worktree(
+                            subject=patch_subject,
+                            body=(
+                                f"Run: {run_id}\nTask: {ready_task.id}\n\n"
+                                f"{summary[:2000]}"
+                            ),
+                            task_id=ready_task.id,
+                            run_id=run_id,
+                            fallback_file=self._tracked_fallback_patch_path(
+                                run_id, ready_task
+                            ),
+                            fallback_content=self._tracked_fallback_patch_content(
+                                run_id,
+                                ready_task,
+                                response.content,
+                            ),
+                            fallback_mode=fallback_mode,
+                            max_files=max_files_per_patch,
+                            forbidden_paths=forbidden_paths,
+                            exclude_paths=isolated_dirty_paths,
+                        )
                     else:
-                        batch = same_type_ready[:max_parallel]
-
-                for ready_task in batch:
-                    self._update_task_status(tasks, ready_task.id, "in_progress")
-                    self._heartbeat_run(run_id, task_id=ready_task.id)
-                    context = self._append_phase_history(
-                        self.state.get_context(),
-                        ready_task.type,
-                        "started",
-                    )
-                    context["phase"] = ready_task.type
-                    self.state.set_context(context)
-
-                    gate: dict[str, Any] | None = None
-                    response: SpecialistResponse | None = None
-                    created_patch: Patch | None = None
-
-                    for attempt in range(1, max_attempts + 1):
-                        ready_task.attempt = attempt
-                        if attempt > 1 and retry_backoff > 0:
-                            delay = retry_backoff * (2 ** (attempt - 2))
-                            await asyncio.sleep(delay)
-                            self._increment_metric("task_retry_count")
-
-                        response = await self._run_specialist(ready_task, goal)
-                        ready_task.output_summary = response.content[:4000]
-                        artifact_path = self._write_task_artifact(run_id, ready_task, response)
-
-                        if ready_task.type == "plan" and len(tasks) == 1:
-                            plan_steps = self._extract_plan_steps(response.content)
-                            if not plan_steps:
-                                plan_steps = supervisor_steps
-                            tasks = self._create_task_graph(goal, plan_steps, pending_modify_tasks)
-                            tasks[0].attempt = ready_task.attempt
-                            tasks[0].output_summary = ready_task.output_summary
-                            self._persist_tasks(tasks)
-                            ready_task = tasks[0]
-
-                        if ready_task.type in {"implement", "document"}:
-                            if self.patches.git_enabled:
-                                created_patch = self.patches.create_task_patch_from_worktree(
-                                    subject=f"architect: {ready_task.id}",
-                                    body=(
-                                        f"Run: {run_id}\nTask: {ready_task.id}\n\n"
-                                        f"{response.content[:2000]}"
-                                    ),
-                                    task_id=ready_task.id,
-                                    run_id=run_id,
-                                    fallback_file=self._tracked_fallback_patch_path(
-                                        run_id, ready_task
-                                    ),
-                                    fallback_content=self._tracked_fallback_patch_content(
-                                        run_id,
-                                        ready_task,
-                                        response.content,
-                                    ),
-                                    fallback_mode=self.config.workflow.fallback_artifact_mode,
-                                    max_files=self.config.guardrails.max_file_changes_per_patch,
-                                    forbidden_paths=list(self.config.guardrails.forbidden_paths),
-                                    exclude_paths=list(self._isolated_dirty_paths),
-                                )
-                            else:
-                                local_path = artifact_path.relative_to(self.repo_root)
-                                created_patch = self.patches.record_local_patch(
-                                    subject=f"architect: {ready_task.id}",
-                                    task_id=ready_task.id,
-                                    run_id=run_id,
-                                    files_changed=[str(local_path).replace("\\", "/")],
-                                )
-                            ready_task.patch_id = created_patch.patch_id
-                            run_patch_files.extend(created_patch.files_changed)
-                            self._append_session_patch(created_patch)
-
-                        gate = self._evaluate_gate(
-                            ready_task,
-                            response,
-                            run_patch_files=run_patch_files,
-                            current_patch=created_patch,
+                        local_path = artifact_path.relative_to(self.repo_root)
+                        created_patch = self.patches.record_local_patch(
+                            subject=patch_subject,
+                            task_id=ready_task.id,
+                            run_id=run_id,
+                            files_changed=[str(local_path).replace("\\", "/")],
                         )
+                    ready_task.patch_id = created_patch.patch_id
+                    run_patch_files.update(dict.fromkeys(created_patch.files_changed))
+                    self._append_session_patch(created_patch)
+
+                gate = self._evaluate_gate(
+                    ready_task,
+                    response,
+                    run_patch_files=run_patch_files,
+                    current_patch=created_patch,
+                )
 
-                        if (
-                            ready_task.type == "plan"
-                            and gate["passed"]
-                            and self.config.workflow.plan_requires_critic
-                        ):
-                            critic = self.specialists.get("critic")
-                            if critic is not None:
-                                plan_review = await critic.run(
-                                    instruction=(
-                                        "Review the following plan for design clarity, interface "
-                                        "completeness, milestone quality, and risk handling. "
-                                        "Use BLOCKER|MAJOR|MINOR|SUGGESTION labels.\n\n"
-                                        f"{response.content[:4000]}"
+                if (
+                    ready_task.type == "plan"
+                    and gate["passed"]
+                    and plan_requires_critic
+                ):
+                    critic = self.specialists.get("critic")
+                    if critic is not None:
+                        plan_key = hashlib.blake2b(
+                            summary.encode("utf-8"), digest_size=16
+                        ).hexdigest()
+                        cached_findings = self._plan_critic_cache.get(plan_key)
+                        if cached_findings is None:
+                            plan_review = await critic.run(
+                                instruction=(
+                                    "Review the following plan for design clarity, interface "
+                                    "completeness, milestone quality, and risk handling. "
+                                    "Use BLOCKER|MAJOR|MINOR|SUGGESTION labels.\n\n"
+                                    f"{summary}"
+                                ),
+                                context={
+                                    "goal": goal,
+                                    # The plan text is already in the instruction, so the
+                                    # task's output_summary is not serialized a second time.
+                                    "task": {
+                                        "id": ready_task.id,
+                                        "type": ready_task.type,
+                                        "description": ready_task.description,
+                                        "depends_on": list(ready_task.depends_on),
+                                        "attempt": ready_task.attempt,
+                                    },
+                                },
+                            )
+                            plan_findings = self._parse_review_findings(plan_review.content)
+                            self._plan_critic_cache[plan_key] = plan_findings
+                            self.state.add_decision(
+                                {
+                                    "id": (
+                                        f"dec-plan-critic-{ready_task.id}-"
+                                        f"{self._decision_serial()}"
                                     ),
-                                    context={"goal": goal, "task": asdict(ready_task)},
-                                )
-                                plan_findings = self._parse_review_findings(plan_review.content)
-                                gate["artifacts"].append(
-                                    {"type": "plan_critic_findings", "counts": plan_findings}
-                                )
-                                self.state.add_decision(
-                                    {
-                                        "id": f"dec-plan-critic-{ready_task.id}-{uuid4().hex[:8]}",
-                                        "topic": "plan_review",
-                                        "decided_by": "critic",
-                                        "approved_by": "supervisor",
-                                        "decision": plan_review.content[:4000],
-                                        "rationale": "Critic review for planning quality gate.",
-                                        "created_at": _utcnow_iso(),
-                                    }
-                                )
-                                if plan_findings["BLOCKER"] > 0:
-                                    gate["passed"] = False
-                                    gate["reason"] = (
-                                        "Planning gate failed due to critic blockers: "
-                                        f"{plan_findings['BLOCKER']}"
-                                    )
-
-                        self._record_gate_result(gate)
-                        if gate["passed"]:
-                            break
-
-                        if attempt < max_attempts:
-                            await self._run_replan(ready_task, gate["reason"], goal)
-                            self._increment_metric("replan_count")
-                            if (
-                                ready_task.type == "review"
-                                and response.content.strip()
-                                and conflict_cycles < max_conflict_cycles
-                            ):
-                                conflict_cycles += 1
-                                remediation_patch = await self._run_conflict_resolution(
-                                    ready_task,
-                                    response.content,
-                                    goal,
-                                    run_id,
-                                )
-                                if remediation_patch is not None:
-                                    run_patch_files.extend(remediation_patch.files_changed)
-                                    self._append_session_patch(remediation_patch)
-                            continue
-
-                    if response is None or gate is None:
-                        raise RuntimeError(
-                            f"Task execution failed unexpectedly for {ready_task.id}"
-                        )
-                    if not gate["passed"]:
-                        self._update_task_status(
-                            tasks,
-                            ready_task.id,
-                            "failed",
-                            reason=gate["reason"],
-                        )
-                        failure_checkpoint = self.patches.create_checkpoint(
-                            f"{run_id}-failed-{ready_task.id}"
-                        )
-                        self.state.add_checkpoint(
+                                    "topic": "plan_review",
+                                    "decided_by": "critic",
+                                    "approved_by": "supervisor",
+                                    "decision": plan_review.content[:4000],
+                                    "rationale": "Critic review for planning quality gate.",
+                                    "created_at": _utcnow_iso(),
+                                }
+                            )
+                        else:
+                            plan_findings = cached_findings
+                        gate["artifacts"].append(
                             {
-                                "id": failure_checkpoint,
-                                "created_at": _utcnow_iso(),
-                                "goal": goal,
-                                "run_id": run_id,
-                                "active_branch": self.patches.current_branch(),
-                                "failure_task_id": ready_task.id,
-                                "failure_reason": gate["reason"],
+                                "type": "plan_critic_findings",
+                                "counts": plan_findings,
+                                "cached": cached_findings is not None,
                             }
                         )
-                        context = self.state.get_context()
-                        context["status"] = "failed"
-                        context["phase"] = ready_task.type
-                        context["ended_at"] = _utcnow_iso()
-                        context["last_failure_checkpoint"] = failure_checkpoint
-                        context = self._append_phase_history(context, ready_task.type, "failed")
-                        self.state.set_context(context)
-                        self._upsert_run_record(
+                        if plan_findings["BLOCKER"] > 0:
+                            gate["passed"] = False
+                            gate["reason"] = (
+                                "Planning gate failed due to critic blockers: "
+                                f"{plan_findings['BLOCKER']}"
+                            )
+
+                self._record_gate_result(gate)
+                if gate["passed"]:
+                    break
+
+                if attempt < max_attempts:
+                    await self._run_replan(ready_task, gate["reason"], goal)
+                    self._increment_metric("replan_count")
+                    if (
+                        ready_task.type == "review"
+                        and response.content.strip()
+                        and conflict_cycles < max_conflict_cycles
+                    ):
+                        conflict_cycles += 1
+                        remediation_patch = await self._run_conflict_resolution(
+                            ready_task,
+                            response.content,
+                            goal,
                             run_id,
-                            {
-                                "status": "failed",
-                                "failed_task_id": ready_task.id,
-                                "failure_reason": gate["reason"],
-                                "last_failure_checkpoint": failure_checkpoint,
-                            },
-                        )
-                        self._release_run_lease(run_id, status="failed")
-                        raise RuntimeError(
-                            "Quality gate failed: "
-                            f"{gate['name']} ({ready_task.id}) - {gate['reason']}"
                         )
-
-                    self._record_decision(ready_task, response)
-                    self._update_task_status(tasks, ready_task.id, "completed")
-                    completed_tasks += 1
-                    self._heartbeat_run(run_id)
-                    context = self._append_phase_history(
-                        self.state.get_context(),
+                        if remediation_patch is not None:
+                            run_patch_files.update(dict.fromkeys(remediation_patch.files_changed))
+                            self._append_session_patch(remediation_patch)
+                    continue
+
+            if response is None or gate is None:
+                raise RuntimeError(
+                    f"Task execution failed unexpectedly for {ready_task.id}"
+                )
+            if not gate["passed"]:
+                # Task, checkpoint, context, run and lease records are persisted together and
+                # stamped with one timestamp.
+                failed_at = _utcnow_iso()
+                with self.state.transaction():
+                    self._update_task_status(
+                        tasks,
+                        task_by_id,
+                        ready_task.id,
+                        "failed",
+                        reason=gate["reason"],
+                        at=failed_at,
+                    )
+                    failure_checkpoint = self.patches.create_checkpoint(
+                        f"{run_id}-failed-{ready_task.id}"
+                    )
+                    self.state.add_checkpoint(
+                        {
+                            "id": failure_checkpoint,
+                            "created_at": failed_at,
+                            "goal": goal,
+                            "run_id": run_id,
+                            "active_branch": self.patches.current_branch(),
+                            "failure_task_id": ready_task.id,
+                            "failure_reason": gate["reason"],
+                        }
+                    )
+                    self._record_phase(
                         ready_task.type,
-                        "completed",
+                        "failed",
+                        status="failed",
+                        phase=ready_task.type,
+                        at=failed_at,
+                        ended_at=failed_at,
+                        last_failure_checkpoint=failure_checkpoint,
                     )
-                    next_phase = {
-                        "plan": "implementation",
-                        "implement": "implementation",
-                        "test": "review",
-                        "review": "documentation",
-                        "document": "complete",
-                    }.get(ready_task.type, "in_progress")
-                    context["phase"] = next_phase
-                    self.state.set_context(context)
-
-            if any(task.status != "completed" for task in tasks):
-                pending = [task.id for task in tasks if task.status != "completed"]
-                raise RuntimeError(f"Task graph did not complete. Pending tasks: {pending}")
+                    self._upsert_run_record(
+                        run_id,
+                        {
+                            "status": "failed",
+                            "failed_task_id": ready_task.id,
+                            "failure_reason": gate["reason"],
+                            "last_failure_checkpoint": failure_checkpoint,
+                        },
+                    )
+                    self._release_run_lease(run_id, status="failed", at=failed_at)
+                raise RuntimeError(
+                    "Quality gate failed: "
+                    f"{gate['name']} ({ready_task.id}) - {gate['reason']}"
+                )
 
-            checkpoint_id = self.patches.create_checkpoint(f"{run_id}-complete")
-            self.state.add_checkpoint(
-                {
-                    "id": checkpoint_id,
-                    "created_at": _utcnow_iso(),
-                    "goal": goal,
-                    "run_id": run_id,
-                    "active_branch": self.patches.current_branch(),
-                }
+            self._record_decision(ready_task, response)
+            completed_at = _utcnow_iso()
+            self._update_task_status(tasks, task_by_id, ready_task.id, "completed", at=completed_at)
+            ready_queue.complete(ready_task.id)
+            completed_tasks += 1
+            self._heartbeat_run(run_id)
+            self._record_phase(
+                ready_task.type,
+                "completed",
+                phase=_NEXT_PHASE.get(ready_task.type, "in_progress"),
+                at=completed_at,
             )
 
-            metrics = self.state.get_metrics()
-            patch_stack = metrics.get("patch_stack", [])
-            if isinstance(patch_stack, list):
-                for item in patch_stack:
-                    if isinstance(item, dict) and item.get("run_id") == run_id:
-                        item["checkpoint_id"] = checkpoint_id
-                metrics["patch_stack"] = patch_stack
-                metrics["last_run_completed_tasks"] = completed_tasks
-                metrics["last_run_id"] = run_id
-                metrics["scheduler_parallelism"] = max_parallel
-                metrics["conflict_resolution_cycles"] = conflict_cycles
-                self.state.set_metrics(metrics)
 
+        ready_queue = _ReadyQueue(tasks)
+        try:
+            while True:
+                head = ready_queue.peek()
+                if head is None:
+                    break
+
+                # Git worktree mutation remains serial for now; non-mutating tasks can batch.
+                serial = max_parallel <= 1 or (
+                    self.patches.git_enabled and head.type in _PATCH_TASK_TYPES
+                )
+                batch = ready_queue.take(1 if serial else max_parallel)
+
+                # The whole layer is marked in progress with one task-graph write.
+                started_at_batch = _utcnow_iso()
+                for ready_task in batch:
+                    self._update_task_status(
+                        tasks,
+                        task_by_id,
+                        ready_task.id,
+                        "in_progress",
+                        persist=False,
+                        at=started_at_batch,
+                    )
+                self._persist_tasks(tasks)
+
+                if len(batch) == 1:
+                    await _execute_task(batch[0])
+                else:
+                    # Independent tasks in a layer overlap their specialist calls; the first
+                    # failure cancels the rest of the layer.
+                    await _gather_failfast([_execute_task(ready_task) for ready_task in batch])
+
+            # completed_tasks only counts this run's completions (a resumed graph already has
+            # some), so the task list itself is checked, in a single pass.
+            pending = [task.id for task in tasks if task.status != "completed"]
+            if pending:
+                raise RuntimeError(f"Task graph did not complete. Pending tasks: {pending}")
+
+            # The completion records (checkpoint, metrics, context, run, lease) share one write
+            # and one timestamp.
             ended_at = _utcnow_iso()
-            final_context = self.state.get_context()
-            final_context.update(
-                {
-                    "goal": goal,
-                    "phase": "complete",
-                    "status": "complete",
-                    "active_branch": self.patches.current_branch(),
-                    "started_at": started_at,
-                    "ended_at": ended_at,
-                    "paused": False,
-                }
-            )
-            session = final_context.get("session", {})
-            if isinstance(session, dict):
-                session["ended_at"] = ended_at
-                session["checkpoint_id"] = checkpoint_id
-                final_context["session"] = session
-            final_context = self._append_phase_history(final_context, "complete", "completed")
-            self.state.set_context(final_context)
-            self._upsert_run_record(
-                run_id,
-                {
-                    "status": "complete",
-                    "ended_at": ended_at,
-                    "checkpoint_id": checkpoint_id,
-                    "completed_tasks": completed_tasks,
-                    "total_tasks": len(tasks),
-                },
-            )
-            self._release_run_lease(run_id, status="complete")
+            with self.state.transaction():
+                checkpoint_id = self.patches.create_checkpoint(f"{run_id}-complete")
+                self.state.add_checkpoint(
+                    {
+                        "id": checkpoint_id,
+                        "created_at": ended_at,
+                        "goal": goal,
+                        "run_id": run_id,
+                        "active_branch": self.patches.current_branch(),
+                    }
+                )
+
+                metrics = self.state.get_metrics()
+                patch_stack = metrics.get("patch_stack", [])
+                if isinstance(patch_stack, list):
+                    for item in patch_stack:
+                        if isinstance(item, dict) and item.get("run_id") == run_id:
+                            item["checkpoint_id"] = checkpoint_id
+                    metrics["patch_stack"] = patch_stack
+                    metrics["last_run_completed_tasks"] = completed_tasks
+                    metrics["last_run_id"] = run_id
+                    metrics["scheduler_parallelism"] = max_parallel
+                    metrics["conflict_resolution_cycles"] = conflict_cycles
+                    self.state.set_metrics(metrics)
+
+                final_context = self.state.get_context()
+                final_context.update(
+                    {
+                        "goal": goal,
+                        "phase": "complete",
+                        "status": "complete",
+                        "active_branch": self.patches.current_branch(),
+                        "started_at": started_at,
+                        "ended_at": ended_at,
+                        "paused": False,
+                    }
+                )
+                session = final_context.get("session", {})
+                if isinstance(session, dict):
+                    session["ended_at"] = ended_at
+                    session["checkpoint_id"] = checkpoint_id
+                    final_context["session"] = session
+                final_context = self._append_phase_history(
+                    final_context, "complete", "completed", at=ended_at
+                )
+                self.state.set_context(final_context)
+                self._upsert_run_record(
+                    run_id,
+                    {
+                        "status": "complete",
+                        "ended_at": ended_at,
+                        "checkpoint_id": checkpoint_id,
+                        "completed_tasks": completed_tasks,
+                        "total_tasks": len(tasks),
+                    },
+                )
+                self._release_run_lease(run_id, status="complete", at=ended_at)
 
             return RunSummary(
                 goal=goal,
@@ -1898,9 +2427,23 @@ class Supervisor:
             "leases": self.state.get_leases(),
             "recent_gate_failures": recent_failures,
             "checkpoints": self.state.get_checkpoints(),
-            "patches": [patch.to_dict() for patch in self.patches.list_patches()],
+            "patches": self._patch_snapshot(),
         }
 
+    def _patch_snapshot(self) -> list[dict[str, Any]]:
+        # Only the log walk is cached; every call gets freshly built dicts, so callers may
+        # mutate the result without affecting later status() calls.
+        key = self._patch_snapshot_key()
+        if self._patches_snapshot is None or self._patches_snapshot[0] != key:
+            patches = tuple(self.patches.list_patches())
+            # Listing can backfill patch indexes into metrics, so the key is taken afterwards.
+            self._patches_snapshot = (self._patch_snapshot_key(), patches)
+        return [patch.to_dict() for patch in self._patches_snapshot[1]]
+
+    def _patch_snapshot_key(self) -> tuple[int, str]:
+        revision = int(self.state.get_envelope("metrics").get("revision", 1))
+        return revision, self.patches.head_commit()
+
     def pause(self) -> None:
         context = self.state.get_context()
         context["paused"] = True
@@ -28,6 +28,20 @@ def _init_repo_with_commits(repo: Path) -> None:
     _run(["git", "commit", "-m", "second"], cwd=repo)
 
 
+def _init_history_repo(repo: Path) -> None:
+    # Root commit with a spaced and a non-ASCII path, then a rename, then an empty commit.
+    _run(["git", "init"], cwd=repo)
+    _run(["git", "config", "user.email", "test@example.com"], cwd=repo)
+    _run(["git", "config", "user.name", "Test User"], cwd=repo)
+    (repo / "with space.txt").write_text("spaced\n", encoding="utf-8")
+    (repo / "ünïcode.txt").write_text("unicode\n", encoding="utf-8")
+    _run(["git", "add", "."], cwd=repo)
+    _run(["git", "commit", "-m", "root"], cwd=repo)
+    _run(["git", "mv", "with space.txt", "renamed file.txt"], cwd=repo)
+    _run(["git", "commit", "-m", "rename"], cwd=repo)
+    _run(["git", "commit", "--allow-empty", "-m", "empty"], cwd=repo)
+
+
 def test_patch_ids_are_stable_and_resolvable(tmp_path: Path) -> None:
     repo = tmp_path / "repo"
     repo.mkdir()
@@ -206,3 +220,57 @@ def test_create_task_patch_can_exclude_paths(tmp_path: Path) -> None:
     assert "a.txt" not in changed
     unstaged = _run(["git", "diff", "--name-only"], cwd=repo)
     assert "a.txt" in unstaged
+
+
+def test_commit_graph_is_opt_in_and_only_seeded_once(tmp_path: Path) -> None:
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    _init_repo_with_commits(repo)
+    chain = repo / ".git" / "objects" / "info" / "commit-graphs" / "commit-graph-chain"
+
+    default_manager = PatchStackManager(repo, state_store=GitNotesStore(repo))
+    assert default_manager._commit_graph_thread is None
+    assert not chain.exists()
+
+    manager = PatchStackManager(repo, state_store=GitNotesStore(repo), write_commit_graph=True)
+    assert manager._commit_graph_thread is not None
+    manager._commit_graph_thread.join(timeout=30)
+    assert chain.exists()
+    seeded = chain.read_text(encoding="utf-8")
+
+    (repo / "c.txt").write_text("c\n", encoding="utf-8")
+    _run(["git", "add", "c.txt"], cwd=repo)
+    _run(["git", "commit", "-m", "third"], cwd=repo)
+    manager._write_commit_graph()
+    assert chain.read_text(encoding="utf-8") == seeded
+
+
+def test_list_patches_parses_log_walk_paths(tmp_path: Path) -> None:
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    _init_history_repo(repo)
+
+    patches = PatchStackManager(repo, state_store=GitNotesStore(repo)).list_patches()
+
+    assert [patch.subject for patch in patches] == ["root", "rename", "empty"]
+    assert sorted(patches[0].files_changed) == ["with space.txt", "ünïcode.txt"]
+    assert patches[1].files_changed == ["renamed file.txt"]
+    assert patches[2].files_changed == []
+
+
+def test_diff_tree_pipe_parses_changed_paths(tmp_path: Path) -> None:
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    _init_history_repo(repo)
+    hashes = _run(["git", "rev-list", "--reverse", "HEAD"], cwd=repo).split()
+    manager = PatchStackManager(repo, state_store=GitNotesStore(repo))
+
+    try:
+        # Two passes: answers must stay aligned when the long-lived process is reused.
+        for _ in range(2):
+            root, rename, empty = (manager._diff_tree_files(commit) for commit in hashes)
+            assert root is not None and sorted(root) == ["with space.txt", "ünïcode.txt"]
+            assert rename == ["renamed file.txt"]
+            assert empty == []
+    finally:
+        manager.close()
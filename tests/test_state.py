@@ -2,7 +2,10 @@ import json
 import subprocess
 from pathlib import Path
 
-from architect.state.git_notes import GitNotesStore
+import pytest
+
+from architect.jsonio import dumps_json, loads_json
+from architect.state.git_notes import ArchitectStateError, GitNotesStore, StateConflictError
 
 
 def _run(cmd: list[str], cwd: Path) -> None:
@@ -93,3 +96,141 @@ def test_git_branch_state_backend_roundtrip(tmp_path: Path) -> None:
         capture_output=True,
     )
     assert show_ref.returncode == 0
+
+
+def test_write_behind_store_serves_reads_and_flushes(tmp_path: Path) -> None:
+    store = GitNotesStore(tmp_path, write_behind=True)
+    store.set_json("metrics", {"count": 1})
+    store.update_json("metrics", lambda payload: {"count": payload["count"] + 1})
+
+    assert store.get_json("metrics") == {"count": 2}
+
+    store.flush()
+    on_disk = json.loads(
+        (tmp_path / ".architect" / "state" / "metrics.json").read_text(encoding="utf-8")
+    )
+    assert on_disk["data"] == {"count": 2}
+    assert on_disk["revision"] == store.get_envelope("metrics")["revision"]
+
+
+def test_write_behind_error_is_reported_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    store = GitNotesStore(tmp_path, write_behind=True)
+    write_many = store._write_many
+    failures = [OSError("transient")]
+
+    def _flaky_write_many(pending: dict[str, str]) -> None:
+        if failures:
+            raise failures.pop()
+        write_many(pending)
+
+    monkeypatch.setattr(store, "_write_many", _flaky_write_many)
+    store.set_json("metrics", {"count": 1})
+    with pytest.raises(ArchitectStateError, match="transient"):
+        store.flush()
+
+    store.set_json("metrics", {"count": 2})
+    store.flush()
+    on_disk = json.loads(
+        (tmp_path / ".architect" / "state" / "metrics.json").read_text(encoding="utf-8")
+    )
+    assert on_disk["data"] == {"count": 2}
+
+
+def test_json_shim_round_trips_integers_beyond_64_bits() -> None:
+    payload = {
+        "big": 2**70,
+        "negative": -(2**64),
+        "below_int64": -(2**63) - 1,
+        "small": 7,
+        "ratio": 0.5,
+    }
+    for encoded in (dumps_json(payload), dumps_json(payload).decode("utf-8")):
+        decoded = loads_json(encoded)
+        assert decoded == payload
+        assert isinstance(decoded["big"], int)
+        assert isinstance(decoded["below_int64"], int)
+    assert loads_json(b'{"a":-9999999999999999999}') == {"a": -9999999999999999999}
+    assert loads_json("-9223372036854775809") == -9223372036854775809
+
+
+def test_metrics_reads_are_cached_until_local_write(tmp_path: Path) -> None:
+    store = GitNotesStore(tmp_path, backend_mode="local", read_cache_ttl=60.0)
+    store.set_metrics({"count": 1})
+    first = store.get_metrics()
+    first["count"] = 99
+    (tmp_path / ".architect" / "state" / "metrics.json").unlink()
+    assert store.get_metrics() == {"count": 1}
+    store.set_metrics({"count": 2})
+    assert store.get_metrics() == {"count": 2}
+
+
+def test_context_writes_refresh_read_cache(tmp_path: Path) -> None:
+    store = GitNotesStore(tmp_path, backend_mode="local", read_cache_ttl=60.0)
+    store.set_context({"phase": "planning"})
+    (tmp_path / ".architect" / "state" / "context.json").unlink()
+    assert store.get_context() == {"phase": "planning"}
+
+
+def test_transaction_persists_buffered_writes_on_exit(tmp_path: Path) -> None:
+    store = GitNotesStore(tmp_path, backend_mode="local")
+    state_dir = tmp_path / ".architect" / "state"
+    with store.transaction():
+        store.set_context({"phase": "complete"})
+        store.update_json("runs", lambda runs: {**runs, "run-1": {"status": "complete"}})
+        assert store.get_json("runs") == {"run-1": {"status": "complete"}}
+        assert not (state_dir / "runs.json").exists()
+    assert store.get_context() == {"phase": "complete"}
+    on_disk = json.loads((state_dir / "runs.json").read_text(encoding="utf-8"))
+    assert on_disk["data"] == {"run-1": {"status": "complete"}}
+
+
+def test_transaction_rejects_writes_made_by_another_store(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    store = GitNotesStore(tmp_path, backend_mode="local", read_cache_ttl=60.0)
+    other = GitNotesStore(tmp_path, backend_mode="local")
+    store.set_context({"phase": "planning"})
+    with pytest.raises(StateConflictError):
+        with store.transaction():
+            store.set_context({"phase": "complete"})
+            other.set_context({"phase": "paused", "paused": True})
+    assert store.get_context() == {"phase": "paused", "paused": True}
+
+    # A conflicting flush does not mask the error that ended the block.
+    with pytest.raises(ValueError, match="boom"):
+        with store.transaction():
+            store.set_context({"phase": "failed"})
+            other.set_context({"phase": "resumed"})
+            raise ValueError("boom")
+    assert store.get_context() == {"phase": "resumed"}
+
+    # Nor does a flush that fails for a reason other than a conflict.
+    def _write_fails(*args: object, **kwargs: object) -> None:
+        raise ArchitectStateError("disk full")
+
+    monkeypatch.setattr(store, "_write_many", _write_fails)
+    with pytest.raises(ValueError, match="boom"):
+        with store.transaction():
+            store.set_context({"phase": "failed"})
+            raise ValueError("boom")
+
+    # Without an error in the block, the flush failure itself surfaces.
+    with pytest.raises(ArchitectStateError, match="disk full"):
+        with store.transaction():
+            store.set_context({"phase": "failed"})
+
+
+def test_patch_metric_deltas_preserve_stack_contract(tmp_path: Path) -> None:
+    store = GitNotesStore(tmp_path, backend_mode="local")
+    store.set_metrics({"retries": 2})
+    store.append_patch_stack({"patch_id": "patch-abc", "commit_hash": "abc", "status": "pending"})
+    store.set_patch_lifecycle("abc", "accepted", note="ok")
+
+    metrics = store.get_metrics()
+    assert metrics["retries"] == 2
+    assert metrics["patch_index"] == {"abc": "patch-abc"}
+    assert metrics["patch_lifecycle"] == {"abc": "accepted"}
+    assert metrics["patch_stack"][0]["status"] == "accepted"
+    assert metrics["patch_stack"][0]["status_note"] == "ok"
@@ -16,7 +16,8 @@ from architect.specialists import (
     TesterAgent,
 )
 from architect.state import GitNotesStore, PatchStackManager
-from architect.supervisor import Supervisor, WorkTask
+from architect.state.git_notes import ArchitectStateError
+from architect.supervisor import Supervisor, WorkTask, _ReadyQueue
 
 
 class FakeBackend(AgentBackend):
@@ -64,6 +65,46 @@ class BlockingPlanCriticBackend(FakeBackend):
             yield chunk
 
 
+class OverlappingCoderBackend(FakeBackend):
+    # Coder calls park on an event until both implement steps are in flight at once, so a
+    # serial scheduler times out instead of passing. A failing step answers with nothing.
+    def __init__(self, *, empty_step: str | None = None) -> None:
+        self.empty_step = empty_step
+        self.active = 0
+        self.peak = 0
+        self.cancelled: list[str] = []
+        self._both_started = asyncio.Event()
+
+    async def execute(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        context: dict[str, Any],
+        tools: list[str] | None = None,
+    ) -> AsyncIterator[str]:
+        if not user_prompt.startswith("Implement step"):
+            async for chunk in super().execute(system_prompt, user_prompt, context, tools):
+                yield chunk
+            return
+        if self.empty_step is not None and user_prompt.startswith(self.empty_step):
+            yield ""
+            return
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        if self.active == 2:
+            self._both_started.set()
+        try:
+            await asyncio.wait_for(self._both_started.wait(), timeout=5)
+            if self.empty_step is not None:
+                await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            self.cancelled.append(user_prompt.split(":", 1)[0])
+            raise
+        finally:
+            self.active -= 1
+        yield f"done: {user_prompt}"
+
+
 def _init_git_repo(repo_path: Path) -> None:
     subprocess.run(["git", "init"], cwd=repo_path, check=True, text=True, capture_output=True)
     subprocess.run(
@@ -136,6 +177,13 @@ def test_supervisor_run_updates_state_and_creates_patches(tmp_path: Path) -> Non
     assert len(status["metrics"]["quality_gates"]) >= 5
     assert any(task["type"] == "implement" for task in status["tasks"])
     assert len(status["patches"]) >= 1
+    status["patches"][0]["status"] = "mutated by caller"
+    status["patches"][0]["files_changed"].append("caller.txt")
+    assert supervisor.status()["patches"][0]["status"] != "mutated by caller"
+    assert "caller.txt" not in supervisor.status()["patches"][0]["files_changed"]
+    first_patch = status["patches"][0]
+    supervisor.patches.update_patch_status(first_patch["commit_hash"], "rejected")
+    assert supervisor.status()["patches"][0]["status"] == "rejected"
     tracked_fallback = subprocess.run(
         ["git", "ls-files", "docs/architect-runs"],
         cwd=repo,
@@ -144,6 +192,10 @@ def test_supervisor_run_updates_state_and_creates_patches(tmp_path: Path) -> Non
         capture_output=True,
     ).stdout.strip()
     assert tracked_fallback == ""
+    # Patch tasks write their artifact before the fallback patch file replaces it.
+    implement_artifacts = sorted((repo / ".architect" / "runs").rglob("task-implement-*.md"))
+    assert implement_artifacts
+    assert all("## Fallback output" in path.read_text() for path in implement_artifacts)
 
 
 def test_supervisor_fails_when_test_gate_command_fails(tmp_path: Path) -> None:
@@ -165,6 +217,128 @@ def test_supervisor_fails_when_test_gate_command_fails(tmp_path: Path) -> None:
     assert status["recent_gate_failures"]
 
 
+def _parallel_config() -> ArchitectConfig:
+    config = ArchitectConfig.default()
+    config.project.lint_command = "python -c \"print('lint ok')\""
+    config.project.type_check_command = "python -c \"print('type ok')\""
+    config.project.test_command = "python -c \"print('test ok')\""
+    config.workflow.max_parallel_tasks = 2
+    config.workflow.task_max_attempts = 1
+    return config
+
+
+def test_parallel_batch_overlaps_specialist_calls(tmp_path: Path) -> None:
+    # Without git the implement steps form one batch; both coder calls must be in flight.
+    backend = OverlappingCoderBackend()
+    supervisor = _build_supervisor(tmp_path, _parallel_config(), backend=backend)
+
+    summary = asyncio.run(supervisor.run("Build JWT auth"))
+
+    assert summary.completed_tasks == summary.total_tasks
+    assert backend.peak == 2
+    assert backend.cancelled == []
+
+
+def test_parallel_batch_failure_cancels_siblings(tmp_path: Path) -> None:
+    backend = OverlappingCoderBackend(empty_step="Implement step 2")
+    supervisor = _build_supervisor(tmp_path, _parallel_config(), backend=backend)
+
+    with pytest.raises(RuntimeError, match="task-implement-002.*Implementation output is empty"):
+        asyncio.run(supervisor.run("Build JWT auth"))
+
+    assert backend.cancelled == ["Implement step 1"]
+    tasks = {task["id"]: task for task in supervisor.status()["tasks"]}
+    assert tasks["task-implement-002"]["status"] == "failed"
+    assert tasks["task-implement-001"]["status"] != "completed"
+
+
+def test_dirty_worktree_paths_parse_renames_and_truncate(tmp_path: Path) -> None:
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    _init_git_repo(repo)
+    supervisor = _build_supervisor(repo, ArchitectConfig.default())
+    subprocess.run(
+        ["git", "mv", "seed.txt", "moved seed.txt"],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+    )
+    (repo / "new file.txt").write_text("new\n", encoding="utf-8")
+    (repo / "ünïcode.txt").write_text("unicode\n", encoding="utf-8")
+
+    paths, truncated = supervisor._dirty_worktree_paths()
+    # The rename reports its destination; the source record is consumed, not listed.
+    assert sorted(paths) == ["moved seed.txt", "new file.txt", "ünïcode.txt"]
+    assert truncated is False
+
+    limited, truncated = supervisor._dirty_worktree_paths(2)
+    assert len(limited) == 2 and set(limited) <= set(paths)
+    assert truncated is True
+    assert supervisor._dirty_worktree_paths(3) == (paths, False)
+
+
+def test_metrics_batch_reads_once_and_skips_unchanged_writes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    supervisor = _build_supervisor(tmp_path, ArchitectConfig.default())
+    supervisor.state.set_metrics({"task_retry_count": 1})
+    reads: list[str] = []
+    writes: list[str] = []
+    get_metrics = supervisor.state.get_metrics
+    update_json = supervisor.state.update_json
+    monkeypatch.setattr(
+        supervisor.state, "get_metrics", lambda: reads.append("metrics") or get_metrics()
+    )
+    monkeypatch.setattr(
+        supervisor.state,
+        "update_json",
+        lambda namespace, *args, **kwargs: (
+            writes.append(namespace) or update_json(namespace, *args, **kwargs)
+        ),
+    )
+
+    with supervisor._metrics_batch():
+        pass
+    assert (reads, writes) == (["metrics"], [])
+
+    supervisor._increment_metric("task_retry_count")
+    assert (reads, writes) == (["metrics", "metrics"], ["metrics"])
+    assert get_metrics()["task_retry_count"] == 2
+
+    # Only keys set through the batch are merged back over a concurrent patch-stack write.
+    with supervisor._metrics_batch():
+        supervisor._increment_metric("task_retry_count")
+        update_json(
+            "metrics", lambda payload: {**payload, "patch_stack": [{"id": "p1"}]}, default={}
+        )
+    assert get_metrics() == {"task_retry_count": 3, "patch_stack": [{"id": "p1"}]}
+
+
+def test_conflict_resolution_failure_is_not_masked_by_decision_write(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    supervisor = _build_supervisor(tmp_path, ArchitectConfig.default())
+
+    async def _coder_down(*args: Any, **kwargs: Any) -> Any:
+        raise RuntimeError("coder down")
+
+    def _state_down(decisions: list[dict[str, Any]]) -> None:
+        raise ArchitectStateError("state down")
+
+    monkeypatch.setattr(supervisor.specialists["coder"], "run", _coder_down)
+    monkeypatch.setattr(supervisor.state, "add_decisions", _state_down)
+    review_task = WorkTask(
+        id="task-review-001", type="review", assigned_to="critic", description="Review"
+    )
+
+    with pytest.raises(RuntimeError, match="coder down"):
+        asyncio.run(
+            supervisor._run_conflict_resolution(  # noqa: SLF001
+                review_task, "BLOCKER: broken", "Build JWT auth", "run-1"
+            )
+        )
+
+
 def test_guardrail_require_tests_for_detects_missing_tests(tmp_path: Path) -> None:
     config = ArchitectConfig.default()
     supervisor = _build_supervisor(tmp_path, config)
@@ -265,6 +439,42 @@ def test_documentation_evidence_uses_configured_patterns(tmp_path: Path) -> None
     assert supervisor._is_documentation_evidence_path("guides/overview.txt")  # noqa: SLF001
 
 
+def test_ready_queue_prefers_critical_path_and_releases_dependents() -> None:
+    tasks = [
+        WorkTask(id="leaf", type="implement", assigned_to="coder", description="leaf"),
+        WorkTask(id="root", type="implement", assigned_to="coder", description="root"),
+        WorkTask(
+            id="child", type="test", assigned_to="tester", description="c", depends_on=["root"]
+        ),
+        WorkTask(
+            id="blocked", type="test", assigned_to="tester", description="b", depends_on=["nope"]
+        ),
+    ]
+    queue = _ReadyQueue(tasks)
+
+    assert queue.peek() is tasks[1]
+    assert [task.id for task in queue.take(1)] == ["root"]
+    tasks[1].status = "completed"
+    queue.complete("root")
+    # "child" does not share the top task's type, so it stays queued for the next batch.
+    assert [task.id for task in queue.take(3)] == ["leaf"]
+    assert [task.id for task in queue.take(3)] == ["child"]
+    assert queue.take(3) == []
+
+
+def test_ready_queue_drops_tasks_that_left_pending_lazily() -> None:
+    tasks = [
+        WorkTask(id=f"task-{index}", type="test", assigned_to="tester", description="t")
+        for index in range(3)
+    ]
+    queue = _ReadyQueue(tasks)
+
+    tasks[0].status = "in_progress"
+    assert queue.peek() is tasks[1]
+    assert [task.id for task in queue.take(5)] == ["task-1", "task-2"]
+    assert queue.peek() is None
+
+
 def test_supervisor_parses_structured_review_findings(tmp_path: Path) -> None:
     supervisor = _build_supervisor(tmp_path, ArchitectConfig.default())
     findings = supervisor._parse_review_findings('{"counts":{"BLOCKER":1,"MAJOR":2}}')  # noqa: SLF001
@@ -274,6 +484,25 @@ def test_supervisor_parses_structured_review_findings(tmp_path: Path) -> None:
     assert findings["MINOR"] == 0
 
 
+def test_extract_json_objects_handles_inline_and_malformed_payloads() -> None:
+    text = (
+        'Summary: {"counts": {"BLOCKER": 1}} and {"coverage_percent": 80} inline\n'
+        '{not json} {"skipped": true}\n'
+        '{\n  "multi": "line"\n}\n'
+        "[1, 2]\n"
+        '{"truncated": '
+    )
+
+    # Objects mid-line and across lines are found; nested objects are not reported twice.
+    # A malformed candidate discards the rest of its line, and partial trailing JSON is ignored.
+    assert Supervisor._extract_json_objects(text) == [  # noqa: SLF001
+        {"counts": {"BLOCKER": 1}},
+        {"coverage_percent": 80},
+        {"multi": "line"},
+    ]
+    assert Supervisor._extract_json_objects("no payload here") == []  # noqa: SLF001
+
+
 def test_supervisor_parses_structured_coverage_payload(tmp_path: Path) -> None:
     supervisor = _build_supervisor(tmp_path, ArchitectConfig.default())
     percent = supervisor._extract_coverage_percent(  # noqa: SLF001